@@ -22,7 +22,8 @@ from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.dispatcher import async_dispatcher_send
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
 
 from ._contracts import bare_ean, is_account_dynamic, service_points_by_ean
 from ._statistics import (
@@ -35,6 +36,7 @@ from .api import (
     EngieBeApiClient,
     EngieBeApiClientAuthenticationError,
     EngieBeApiClientError,
+    access_token_expiry,
 )
 from .const import (
     ATTR_END_DATE,
@@ -59,6 +61,9 @@ from .const import (
     SIGNAL_AUTHENTICATION_STATE_CHANGED,
     SUBENTRY_TYPE_BUSINESS_AGREEMENT,
     TOKEN_REFRESH_INTERVAL_SECONDS,
+    TOKEN_REFRESH_MARGIN_SECONDS,
+    TOKEN_REFRESH_MIN_DELAY_SECONDS,
+    TOKEN_REUSE_MIN_VALIDITY_SECONDS,
 )
 from .coordinator import (
     EngieBeDataUpdateCoordinator,
@@ -67,6 +72,7 @@ from .coordinator import (
 )
 from .data import EngieBeData, EngieBeSubentryData
 from .diagnostics import _hash_ean
+from .entity import subentry_device_info
 from .store import EngieBeHappyHoursStore, EngieBePeaksStore
 
 if TYPE_CHECKING:
@@ -188,42 +194,59 @@ async def async_setup_entry(  # noqa: PLR0915 - orchestrator, splitting hurts re
 
     # Initial token refresh so per-subentry coordinators have a valid
     # access token to make their first authenticated request with.
-    try:
-        new_access, new_refresh = await client.async_refresh_token()
-    except EngieBeApiClientAuthenticationError as err:
-        msg = "Stored ENGIE credentials are no longer valid"
-        raise ConfigEntryAuthFailed(msg) from err
-    except EngieBeApiClientError as err:
-        msg = "Unable to refresh ENGIE access token; will retry"
-        raise ConfigEntryNotReady(msg) from err
-
-    _persist_tokens(hass, entry, new_access, new_refresh)
+    await _async_initial_token_refresh(hass, entry, client)
     _set_authenticated(hass, entry, authenticated=True)
 
     # Recurring token refresh (one timer per parent entry, not per
-    # subentry: tokens are login-scoped, not account-scoped).
+    # subentry: tokens are login-scoped, not account-scoped). Each run
+    # re-arms a one-shot timer for the next deadline rather than polling on
+    # a fixed interval, so a longer-lived token is refreshed less often.
+    runtime = entry.runtime_data
+    token_refresh_stopped = False
+
+    def _stop_token_refresh() -> None:
+        """Cancel the armed timer and keep an in-flight run from re-arming."""
+        nonlocal token_refresh_stopped
+        token_refresh_stopped = True
+        _cancel_token_refresh(entry)
+
+    def _schedule_token_refresh(delay: float) -> None:
+        """Arm the one-shot refresh timer ``delay`` seconds from now."""
+        # An unload (or reload) can land while a refresh is awaiting the
+        # network. Re-arming then would keep a dead client rotating the
+        # shared refresh token and write its handle onto the next setup's
+        # runtime data, so a stopped run never re-arms.
+        if token_refresh_stopped:
+            return
+        runtime.cancel_token_refresh = async_call_later(
+            hass, delay, _refresh_token_callback
+        )
+
     async def _refresh_token_callback(_now: object) -> None:
-        """Refresh the access token periodically."""
+        """Refresh the access token and schedule the next refresh."""
+        # The one-shot timer that invoked us has fired; drop its handle so
+        # the auth-error path below leaves no timer armed.
+        runtime.cancel_token_refresh = None
+        # Re-armed from ``finally`` on every path except the auth-error one,
+        # so an unexpected failure cannot end token refresh for good.
+        next_delay: float | None = TOKEN_REFRESH_INTERVAL_SECONDS
         try:
             new_access, new_refresh = await client.async_refresh_token()
         except EngieBeApiClientAuthenticationError:
+            next_delay = None
+            if token_refresh_stopped:
+                return
             _set_authenticated(hass, entry, authenticated=False)
             LOGGER.warning(
                 "Scheduled token refresh rejected by ENGIE; starting reauth flow"
             )
-            # Cancel the timer before starting reauth so it does not keep
-            # firing 403s every 60s until the user completes the reauth
-            # flow and the entry reloads. The on_unload path remains armed
-            # as belt-and-braces; calling the cancel callable twice is safe
-            # because async_track_time_interval returns an idempotent remove
-            # listener closure.
-            runtime = entry.runtime_data
-            if runtime.cancel_token_refresh is not None:
-                runtime.cancel_token_refresh()
-                runtime.cancel_token_refresh = None
+            # Do not re-arm the timer before starting reauth, so it does not
+            # keep firing 403s until the user completes the reauth flow and
+            # the entry reloads.
             entry.async_start_reauth(hass)
-            return
         except EngieBeApiClientError as err:
+            if token_refresh_stopped:
+                return
             _set_authenticated(hass, entry, authenticated=False)
             # The API client embeds HTTP status / underlying exception class
             # into the message (see api.py: "HTTP {status}: {body_preview}",
@@ -235,11 +258,27 @@ async def async_setup_entry(  # noqa: PLR0915 - orchestrator, splitting hurts re
                 type(err).__name__,
                 err,
             )
-            return
-
-        _persist_tokens(hass, entry, new_access, new_refresh)
-        _set_authenticated(hass, entry, authenticated=True)
-        LOGGER.debug("Token refreshed successfully")
+        except Exception:  # noqa: BLE001 - the timer must outlive unexpected errors
+            if token_refresh_stopped:
+                return
+            _set_authenticated(hass, entry, authenticated=False)
+            LOGGER.exception("Unexpected error during scheduled token refresh")
+        else:
+            if token_refresh_stopped:
+                # Unloaded mid-refresh. ENGIE has already rotated the refresh
+                # token, so still store the new pair unless the entry is gone.
+                if hass.config_entries.async_get_entry(entry.entry_id) is entry:
+                    _persist_tokens(hass, entry, new_access, new_refresh)
+                return
+            _persist_tokens(hass, entry, new_access, new_refresh)
+            _set_authenticated(hass, entry, authenticated=True)
+            next_delay = _token_refresh_delay(new_access)
+            LOGGER.debug(
+                "Token refreshed successfully; next refresh in %.0fs", next_delay
+            )
+        finally:
+            if next_delay is not None:
+                _schedule_token_refresh(next_delay)
 
     # Build per-subentry coordinators, peak stores and service-points
     # lookups, then do their initial refreshes in parallel so that a
@@ -264,6 +303,7 @@ async def async_setup_entry(  # noqa: PLR0915 - orchestrator, splitting hurts re
             coordinator=coordinator,
             peaks_store=peaks_store,
             happy_hours_store=happy_hours_store,
+            device_info=subentry_device_info(subentry),
         )
 
     # Refresh EPEX once at startup alongside the per-subentry data;
@@ -385,13 +425,8 @@ async def async_setup_entry(  # noqa: PLR0915 - orchestrator, splitting hurts re
     # See ``.opencode/audit-v0.10.0b1-prerelease.md`` Blocker B1a.
     # Note: the update listener (registered above, before the first await)
     # is intentionally placed earlier; it is safe on a half-set-up entry.
-    cancel_refresh = async_track_time_interval(
-        hass,
-        _refresh_token_callback,
-        timedelta(seconds=TOKEN_REFRESH_INTERVAL_SECONDS),
-    )
-    entry.runtime_data.cancel_token_refresh = cancel_refresh
-    entry.async_on_unload(cancel_refresh)
+    _schedule_token_refresh(_token_refresh_delay(client.access_token))
+    entry.async_on_unload(_stop_token_refresh)
 
     return True
 
@@ -987,15 +1022,98 @@ def _persist_tokens(
     refresh token on every successful exchange, so in practice this
     short-circuit only fires when the OAuth helper returns a cached
     token (e.g. when the previous access token is still valid).
+
+    The write is deliberately not debounced. Each refresh consumes the
+    previous refresh token server-side, so a rotated pair held back in
+    memory and lost to a crash or power cut would leave only a dead token
+    on disk and force a full MFA reauth. Home Assistant already coalesces
+    the resulting ``core.config_entries`` saves, and the expiry-driven
+    refresh schedule keeps the number of rotations low.
     """
     current_access = entry.data.get(CONF_ACCESS_TOKEN)
     current_refresh = entry.data.get(CONF_REFRESH_TOKEN)
     if current_access == access_token and current_refresh == refresh_token:
         return
-    updated_data = {**entry.data}
-    updated_data[CONF_ACCESS_TOKEN] = access_token
-    updated_data[CONF_REFRESH_TOKEN] = refresh_token
-    hass.config_entries.async_update_entry(entry, data=updated_data)
+    hass.config_entries.async_update_entry(
+        entry,
+        data={
+            **entry.data,
+            CONF_ACCESS_TOKEN: access_token,
+            CONF_REFRESH_TOKEN: refresh_token,
+        },
+    )
+
+
+async def _async_initial_token_refresh(
+    hass: HomeAssistant,
+    entry: EngieBeConfigEntry,
+    client: EngieBeApiClient,
+) -> None:
+    """
+    Make sure the client holds a usable access token before setup continues.
+
+    A persisted access token that is still valid for at least
+    ``TOKEN_REUSE_MIN_VALIDITY_SECONDS`` (typically after a quick restart)
+    is reused as-is, keeping the refresh round trip off the startup path
+    and leaving rotation to the scheduled refresh. Otherwise the pair is
+    refreshed and persisted, mapping auth failures to
+    ``ConfigEntryAuthFailed`` and anything else to ``ConfigEntryNotReady``.
+    """
+    if _token_validity_seconds(client.access_token) >= (
+        TOKEN_REUSE_MIN_VALIDITY_SECONDS
+    ):
+        LOGGER.debug("Stored access token still valid; skipping initial refresh")
+        return
+    try:
+        new_access, new_refresh = await client.async_refresh_token()
+    except EngieBeApiClientAuthenticationError as err:
+        msg = "Stored ENGIE credentials are no longer valid"
+        raise ConfigEntryAuthFailed(msg) from err
+    except EngieBeApiClientError as err:
+        msg = "Unable to refresh ENGIE access token; will retry"
+        raise ConfigEntryNotReady(msg) from err
+    _persist_tokens(hass, entry, new_access, new_refresh)
+
+
+def _token_validity_seconds(access_token: str | None) -> float:
+    """
+    Return how many seconds the access token stays valid (negative if expired).
+
+    Returns ``0.0`` when the token has no readable JWT ``exp`` claim, so an
+    opaque or missing token is always treated as needing a refresh.
+    """
+    expiry = access_token_expiry(access_token)
+    if expiry is None:
+        return 0.0
+    return (expiry - dt_util.utcnow()).total_seconds()
+
+
+def _token_refresh_delay(access_token: str | None) -> float:
+    """
+    Return the seconds to wait before the next scheduled token refresh.
+
+    Targets ``TOKEN_REFRESH_MARGIN_SECONDS`` before the access token's JWT
+    ``exp`` claim, floored at ``TOKEN_REFRESH_MIN_DELAY_SECONDS`` so a token
+    that is already (nearly) expired cannot spin the timer. Falls back to
+    ``TOKEN_REFRESH_INTERVAL_SECONDS`` when the token has no readable
+    ``exp``.
+    """
+    expiry = access_token_expiry(access_token)
+    if expiry is None:
+        return TOKEN_REFRESH_INTERVAL_SECONDS
+    remaining = (expiry - dt_util.utcnow()).total_seconds()
+    return max(
+        remaining - TOKEN_REFRESH_MARGIN_SECONDS,
+        TOKEN_REFRESH_MIN_DELAY_SECONDS,
+    )
+
+
+def _cancel_token_refresh(entry: EngieBeConfigEntry) -> None:
+    """Cancel the pending token-refresh timer, if one is armed."""
+    runtime = entry.runtime_data
+    if runtime.cancel_token_refresh is not None:
+        runtime.cancel_token_refresh()
+        runtime.cancel_token_refresh = None
 
 
 def _set_authenticated(
@@ -0,0 +1,152 @@
+"""Pure helpers for the supplier energy-prices payload."""
+
+from __future__ import annotations
+
+import contextlib
+from bisect import bisect_right
+from datetime import date
+from itertools import pairwise
+from operator import itemgetter
+from typing import Any
+
+from .data import EnergyPrice, EnergyPrices
+
+
+def price_bounds(price: Any) -> tuple[int, int] | None:
+    """
+    Return the ``(from, to)`` date ordinals of a raw price entry.
+
+    Returns ``None`` for an entry that is not a dict or whose ``from``/
+    ``to`` dates are missing or unparseable.
+    """
+    if not isinstance(price, dict):
+        return None
+    try:
+        from_ord = date.fromisoformat(price["from"]).toordinal()
+        to_ord = date.fromisoformat(price["to"]).toordinal()
+    except KeyError, ValueError, TypeError:
+        return None
+    return from_ord, to_ord
+
+
+def _parse_price(price: dict[str, Any]) -> EnergyPrice:
+    """Convert one raw price entry into an :class:`EnergyPrice`."""
+    bounds = price_bounds(price)
+    rates: dict[tuple[str, str, str], float] = {}
+    slots: dict[str, tuple[str, ...]] = {}
+    configs = price.get("proportionalPriceConfigurations")
+    if isinstance(configs, dict):
+        for direction, slot_entries in configs.items():
+            if not isinstance(slot_entries, list):
+                continue
+            seen: list[str] = []
+            for slot_entry in slot_entries:
+                if not isinstance(slot_entry, dict):
+                    continue
+                # A missing code is the flat rate, as ENGIE omits it there.
+                slot_code = slot_entry.get("timeOfUseSlotCode", "TOTAL_HOURS")
+                # The first entry for a slot code wins.
+                if not isinstance(slot_code, str) or slot_code in seen:
+                    continue
+                seen.append(slot_code)
+                for field, value in slot_entry.items():
+                    if value is None:
+                        continue
+                    # Coerce once per refresh; non-numeric fields (the
+                    # slot code itself, "N/A" placeholders) are dropped.
+                    with contextlib.suppress(TypeError, ValueError):
+                        rates[direction, slot_code, field] = float(value)
+            slots[direction] = tuple(seen)
+    return EnergyPrice(
+        from_ord=bounds[0] if bounds else None,
+        to_ord=bounds[1] if bounds else None,
+        valid_from=price.get("from"),
+        valid_to=price.get("to"),
+        vat_tariff=price.get("vatTariff"),
+        rates=rates,
+        slots=slots,
+    )
+
+
+def _parse_prices(prices: Any) -> EnergyPrices:
+    """Parse one item's ``prices`` list into bisectable windows."""
+    entries = (
+        [_parse_price(p) for p in prices if isinstance(p, dict)]
+        if isinstance(prices, list)
+        else []
+    )
+    bounded = [
+        (e.from_ord, e.to_ord, e)
+        for e in entries
+        if e.from_ord is not None and e.to_ord is not None
+    ]
+    starts = sorted(bounded, key=itemgetter(0))
+    # Sorted by start, any overlap shows up between neighbours.
+    overlapping = any(a[1] > b[0] for a, b in pairwise(starts))
+    # Overlapping windows leave no single candidate to bisect for: keep
+    # API order so the lookup can take the first covering window, as the
+    # linear scan did.
+    ordered = bounded if overlapping else starts
+    return EnergyPrices(
+        windows=tuple(e for _, _, e in ordered),
+        from_ords=tuple(start for start, _, _ in ordered),
+        fallback=entries[-1] if entries else None,
+        overlapping=overlapping,
+    )
+
+
+def parse_price_items(items: Any) -> dict[str, EnergyPrices]:
+    """
+    Parse the prices payload's ``items`` into typed entries keyed by ``ean``.
+
+    Built once per coordinator refresh so every price sensor resolves its
+    entries with one dict lookup and reads typed fields on each state
+    read instead of walking the raw JSON. Keys keep the delivery-point
+    suffix (``..._ID1``) because that is what the sensors are constructed
+    with. Non-dict items, items without a string ``ean`` and non-dict
+    price entries are skipped; a duplicate EAN keeps its first
+    occurrence.
+    """
+    index: dict[str, EnergyPrices] = {}
+    if not isinstance(items, list):
+        return index
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        ean = item.get("ean")
+        if not isinstance(ean, str) or ean in index:
+            continue
+        index[ean] = _parse_prices(item.get("prices"))
+    return index
+
+
+def current_price(prices: EnergyPrices, today_ord: int) -> EnergyPrice | None:
+    """
+    Return the window covering ``today_ord``, or the fallback entry.
+
+    Supplier price windows are normally contiguous, so the only candidate
+    is the last window starting on or before ``today_ord``;
+    ``bisect_right`` finds it in O(log n). Overlapping windows (such as an
+    open-ended default next to a dated tariff) fall back to the first
+    covering window in API order.
+    """
+    windows = prices.windows
+    # No window, or a single window that is also the fallback: every
+    # date resolves to the fallback (the common one-tariff-row shape).
+    if not windows or (len(windows) == 1 and windows[0] is prices.fallback):
+        return prices.fallback
+    if prices.overlapping:
+        for window in windows:
+            if (
+                window.from_ord is not None
+                and window.to_ord is not None
+                and window.from_ord <= today_ord < window.to_ord
+            ):
+                return window
+        return prices.fallback
+    idx = bisect_right(prices.from_ords, today_ord) - 1
+    if idx >= 0:
+        window = windows[idx]
+        if window.to_ord is not None and today_ord < window.to_ord:
+            return window
+    return prices.fallback
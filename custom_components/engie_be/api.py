@@ -6,14 +6,14 @@ import asyncio
 import hashlib
 import os
 import re
-import socket
-from base64 import urlsafe_b64encode
+from base64 import urlsafe_b64decode, urlsafe_b64encode
 from dataclasses import dataclass
 from datetime import UTC, date, datetime
 from http import HTTPStatus
 from typing import Any, Literal, NoReturn, overload
 
 import aiohttp
+from homeassistant.util.json import json_loads
 
 from ._api_logging import RequestLogger, _redact_text
 from .const import (
@@ -110,10 +110,42 @@ _BROWSER_HEADERS: dict[str, str] = {
     "sec-ch-ua-platform": '"Android"',
 }
 
+# Per-request timeout enforced by aiohttp itself (connect, send and body
+# read), so no extra ``asyncio.timeout`` scope is needed around each call.
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=10)
+
+# Headers for the native-app ``/oauth/token`` exchanges (auth step 13 and
+# every scheduled refresh).
+_TOKEN_HEADERS: dict[str, str] = {
+    "Accept": "application/json",
+    "Content-Type": "application/x-www-form-urlencoded",
+    "User-Agent": USER_AGENT_NATIVE,
+}
+
+# Constant part of the refresh-token grant; only the rotating refresh token
+# and the client id are merged in per call.
+_REFRESH_DATA_TEMPLATE: dict[str, str] = {
+    "audience": OAUTH_AUDIENCE,
+    "grant_type": "refresh_token",
+    "scope": OAUTH_SCOPES,
+    "redirect_uri": REDIRECT_URI,
+}
+
+# Browser-capability fields the Auth0 login forms (steps 3 and 5) expect.
+_LOGIN_FIELDS_BASE: dict[str, str] = {
+    "js-available": "true",
+    "webauthn-available": "true",
+    "is-brave": "false",
+    "webauthn-platform-available": "true",
+}
+
 
 def _base64url(data: bytes) -> str:
     """Encode bytes to a Base64-URL string (no padding)."""
-    return urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+    # The number of ``=`` pad characters is fixed by ``len(data) % 3``, so
+    # slice them off instead of scanning the output with ``rstrip``.
+    encoded = urlsafe_b64encode(data).decode("ascii")
+    return encoded[: len(encoded) - (-len(data) % 3)]
 
 
 def _generate_pkce() -> tuple[str, str, str, str]:
@@ -122,17 +154,66 @@ def _generate_pkce() -> tuple[str, str, str, str]:
 
     Returns (state, nonce, code_verifier, code_challenge).
     """
-    state = os.urandom(16).hex()
-    nonce = os.urandom(16).hex()
-    code_verifier = _base64url(os.urandom(32))
+    # One 64-byte draw sliced three ways instead of three getrandom() calls.
+    random_bytes = os.urandom(64)
+    state = random_bytes[:16].hex()
+    nonce = random_bytes[16:32].hex()
+    code_verifier = _base64url(random_bytes[32:])
     code_challenge = _base64url(hashlib.sha256(code_verifier.encode("ascii")).digest())
     return state, nonce, code_verifier, code_challenge
 
 
-def _extract_from_body(body: str, pattern: str) -> str | None:
-    """Extract a value from an HTML body using a regex pattern."""
-    match = re.search(pattern, body)
-    return match.group(1) if match else None
+# Auth0 state tokens and authorization codes are URL-safe base64, so one
+# compiled value pattern serves both. ``re.ASCII`` keeps ``\w`` equal to
+# ``[a-zA-Z0-9_]`` rather than every Unicode word character.
+_TOKEN_RE = re.compile(r"[\w-]+", re.ASCII)
+
+
+def _extract_from_body(body: str, anchor: str) -> str | None:
+    """
+    Extract the token following ``anchor`` (``"state="`` / ``"code="``).
+
+    The anchor is located with ``str.find`` and the token regex is
+    anchored right after it, so the regex never scans the rest of the
+    Auth0 page. An occurrence not followed by a token (e.g. an empty
+    ``state=`` query parameter) is skipped in favour of the next one.
+    """
+    idx = body.find(anchor)
+    while idx != -1:
+        start = idx + len(anchor)
+        match = _TOKEN_RE.match(body, start)
+        if match:
+            return match.group()
+        idx = body.find(anchor, start)
+    return None
+
+
+def access_token_expiry(access_token: str | None) -> datetime | None:
+    """
+    Return the ``exp`` claim of a JWT access token as an aware UTC datetime.
+
+    The signature is not verified: the value only decides when the
+    integration refreshes, never whether a request is authorised. Returns
+    ``None`` for a missing, opaque or malformed token so callers can fall
+    back to a fixed refresh interval.
+    """
+    if not access_token:
+        return None
+    parts = access_token.split(".")
+    if len(parts) != 3:  # noqa: PLR2004 - header.payload.signature
+        return None
+    payload = parts[1]
+    try:
+        claims = json_loads(urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except ValueError:
+        return None
+    exp = claims.get("exp") if isinstance(claims, dict) else None
+    if not isinstance(exp, int | float):
+        return None
+    try:
+        return datetime.fromtimestamp(exp, tz=UTC)
+    except OverflowError, OSError, ValueError:
+        return None
 
 
 # Public re-export so non-HTTP modules (coordinator, platforms) can mask
@@ -170,7 +251,7 @@ class EngieBeApiClient:
         self.refresh_token = refresh_token
         # Serialises async_refresh_token against itself. ENGIE rotates the
         # refresh token on every call, so two concurrent refreshes (e.g.
-        # the periodic 60s timer firing while a coordinator's auth-failure
+        # the scheduled refresh timer firing while a coordinator's auth-failure
         # retry path also calls refresh) would consume the same refresh
         # token twice and the second caller would 400 -> spurious reauth.
         # The lock + "did someone else refresh while I was waiting?" check
@@ -179,6 +260,19 @@ class EngieBeApiClient:
         self._token_lock = asyncio.Lock()
         self._req_logger = RequestLogger()
 
+    @property
+    def access_token(self) -> str | None:
+        """Return the current OAuth access token."""
+        return self._access_token
+
+    @access_token.setter
+    def access_token(self, token: str | None) -> None:
+        """Store a new access token and drop the headers built for the old one."""
+        self._access_token = token
+        # Authenticated header dicts keyed by User-Agent, rebuilt lazily
+        # once per token rotation rather than on every request.
+        self._auth_headers: dict[str, dict[str, str]] = {}
+
     # ------------------------------------------------------------------
     # Phase 1: start authentication (config-flow step 1 triggers this)
     # Runs auth steps 1-7, returns intermediate state so the config flow
@@ -198,8 +292,20 @@ class EngieBeApiClient:
         When it is ``email`` the ALT authenticator-switching detour runs
         instead (no SMS is sent).  The caller must then collect the code
         and pass it to ``async_complete_authentication``.
+
+        The flow runs on its own session so Auth0 cookies stay isolated
+        from the shared Home Assistant session, but it borrows that
+        session's connector: the 7-13 sequential requests to
+        ``AUTH_BASE_URL`` then reuse pooled keep-alive TCP/TLS connections
+        instead of handshaking on a fresh pool per login. With
+        ``connector_owner=False`` closing the flow session leaves the
+        shared connector untouched.
         """
-        auth_session = aiohttp.ClientSession()
+        auth_session = aiohttp.ClientSession(
+            cookie_jar=aiohttp.CookieJar(),
+            connector=self._session.connector,
+            connector_owner=False,
+        )
         try:
             return await self._run_auth_steps_1_to_7(
                 auth_session, username, password, mfa_method
@@ -227,24 +333,24 @@ class EngieBeApiClient:
         errors.  On ``EngieBeApiClientMfaError`` the session is kept open so
         the caller can retry with a corrected code.
         """
+        close_session = True
         try:
             access_token, refresh_token = await self._run_auth_steps_8_to_13(
                 flow_state, mfa_code, mfa_method=mfa_method
             )
         except EngieBeApiClientMfaError:
             # Keep session open - user can retry with a new code
+            close_session = False
             raise
-        except BaseException:
-            await flow_state.session.close()
-            raise
-        else:
-            await flow_state.session.close()
-            self.access_token = access_token
-            self.refresh_token = refresh_token
-            return access_token, refresh_token
+        finally:
+            if close_session:
+                await flow_state.session.close()
+        self.access_token = access_token
+        self.refresh_token = refresh_token
+        return access_token, refresh_token
 
     # ------------------------------------------------------------------
-    # Token refresh  (runs on a 60-second timer after setup)
+    # Token refresh  (scheduled ahead of access-token expiry after setup)
     # ------------------------------------------------------------------
 
     async def async_refresh_token(self) -> tuple[str, str]:
@@ -293,17 +399,9 @@ class EngieBeApiClient:
 
             data = {
                 "refresh_token": self.refresh_token,
-                "audience": OAUTH_AUDIENCE,
-                "grant_type": "refresh_token",
-                "scope": OAUTH_SCOPES,
-                "redirect_uri": REDIRECT_URI,
+                **_REFRESH_DATA_TEMPLATE,
                 "client_id": self._client_id,
             }
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/x-www-form-urlencoded",
-                "User-Agent": USER_AGENT_NATIVE,
-            }
 
             old_refresh_tail = _redact_text(self.refresh_token)
 
@@ -312,12 +410,19 @@ class EngieBeApiClient:
                 method="POST",
                 url=f"{AUTH_BASE_URL}/oauth/token",
                 data=data,
-                headers=headers,
+                headers=_TOKEN_HEADERS,
                 json_response=True,
             )
 
-            self.access_token = result["access_token"]
-            self.refresh_token = result["refresh_token"]
+            access_token = result.get("access_token")
+            refresh_token = result.get("refresh_token")
+            if not isinstance(access_token, str) or not isinstance(refresh_token, str):
+                # A 2xx without the token pair would otherwise surface as a
+                # bare KeyError past every caller's API-error handling.
+                msg = "Token refresh response is missing the token pair"
+                raise EngieBeApiClientError(msg)
+            self.access_token = access_token
+            self.refresh_token = refresh_token
 
             LOGGER.debug(
                 "Token refresh: rotated refresh_token %s -> %s, "
@@ -351,11 +456,7 @@ class EngieBeApiClient:
             f"{API_BASE_URL}/business-agreements/"
             f"{business_agreement_number.replace(' ', '')}/supplier-energy-prices"
         )
-        headers = {
-            "User-Agent": USER_AGENT_BROWSER,
-            "Accept": "application/json, application/problem+json",
-            "authorization": f"Bearer {self.access_token}",
-        }
+        headers = self._authenticated_headers(user_agent=USER_AGENT_BROWSER)
         return await self._api_wrapper(
             session=self._session,
             method="GET",
@@ -431,11 +532,7 @@ class EngieBeApiClient:
         field (``"ELECTRICITY"`` or ``"GAS"``).
         """
         url = f"{PREMISES_BASE_URL}/service-points/{ean}"
-        headers = {
-            "User-Agent": USER_AGENT_BROWSER,
-            "Accept": "application/json, application/problem+json",
-            "authorization": f"Bearer {self.access_token}",
-        }
+        headers = self._authenticated_headers(user_agent=USER_AGENT_BROWSER)
         return await self._api_wrapper(
             session=self._session,
             method="GET",
@@ -927,7 +1024,7 @@ class EngieBeApiClient:
             headers=_BROWSER_HEADERS,
             allow_redirects=False,
         )
-        authorize_state = _extract_from_body(body, r"state=([a-zA-Z0-9_-]+)")
+        authorize_state = _extract_from_body(body, "state=")
         if not authorize_state:
             msg = "Failed to extract authorize state from response"
             raise EngieBeApiClientAuthenticationError(msg)
@@ -942,6 +1039,7 @@ class EngieBeApiClient:
             params={"state": authorize_state, "ui_locales": "nl"},
             headers=_BROWSER_HEADERS,
             allow_redirects=False,
+            discard_body=True,
         )
         LOGGER.debug("Auth step 2 complete: loaded login page")
 
@@ -956,14 +1054,12 @@ class EngieBeApiClient:
                 "state": authorize_state,
                 "allow-passkeys": "true",
                 "username": username,
-                "js-available": "true",
-                "webauthn-available": "true",
-                "is-brave": "false",
-                "webauthn-platform-available": "true",
+                **_LOGIN_FIELDS_BASE,
                 "ulp-remember-me-present": "true",
                 "ulp-remember-me": "on",
             },
             allow_redirects=False,
+            discard_body=True,
         )
         LOGGER.debug("Auth step 3 complete: submitted username")
 
@@ -975,6 +1071,7 @@ class EngieBeApiClient:
             params={"state": authorize_state, "ui_locales": "nl"},
             headers=_BROWSER_HEADERS,
             allow_redirects=False,
+            discard_body=True,
         )
         LOGGER.debug("Auth step 4 complete: loaded password page")
 
@@ -989,14 +1086,11 @@ class EngieBeApiClient:
                 "state": authorize_state,
                 "username": username,
                 "password": password,
-                "js-available": "true",
-                "webauthn-available": "true",
-                "is-brave": "false",
-                "webauthn-platform-available": "true",
+                **_LOGIN_FIELDS_BASE,
             },
             allow_redirects=False,
         )
-        login_state = _extract_from_body(body, r"state=([a-zA-Z0-9_-]+)")
+        login_state = _extract_from_body(body, "state=")
         if not login_state:
             msg = "Login failed: could not extract login state (bad credentials?)"
             raise EngieBeApiClientAuthenticationError(msg)
@@ -1012,7 +1106,7 @@ class EngieBeApiClient:
             headers=_BROWSER_HEADERS,
             allow_redirects=False,
         )
-        mfa_challenge_state = _extract_from_body(body, r"state=([a-zA-Z0-9_-]+)")
+        mfa_challenge_state = _extract_from_body(body, "state=")
         if not mfa_challenge_state:
             msg = "Failed to extract MFA challenge state"
             raise EngieBeApiClientAuthenticationError(msg)
@@ -1028,6 +1122,7 @@ class EngieBeApiClient:
                 params={"state": mfa_challenge_state, "ui_locales": "nl"},
                 headers=_BROWSER_HEADERS,
                 allow_redirects=False,
+                discard_body=True,
             )
             LOGGER.debug("Auth step 7 complete: SMS sent to user")
         else:
@@ -1062,7 +1157,7 @@ class EngieBeApiClient:
         # The response should contain a new state; if it doesn't the
         # code was most likely wrong (server returned 400 with the MFA
         # form again).
-        another_state = _extract_from_body(body, r"state=([a-zA-Z0-9_-]+)")
+        another_state = _extract_from_body(body, "state=")
         if not another_state:
             msg = "Invalid MFA code or failed to proceed after MFA submission"
             raise EngieBeApiClientMfaError(msg)
@@ -1109,7 +1204,7 @@ class EngieBeApiClient:
         location = resp_headers.get("Location", "")
         if location.startswith(REDIRECT_URI):
             # Outcome A: Auth code is already in the Location header.
-            auth_code = _extract_from_body(location, r"code=([a-zA-Z0-9_-]+)")
+            auth_code = _extract_from_body(location, "code=")
             if not auth_code:
                 msg = (
                     "Step 9 redirected to the native callback URI but the "
@@ -1122,14 +1217,21 @@ class EngieBeApiClient:
             )
         else:
             # Outcome B: Passkey-enrollment interstitial.
-            passkey_state = _extract_from_body(body, r"state=([a-zA-Z0-9_-]+)")
+            passkey_state = _extract_from_body(body, "state=")
             if not passkey_state:
                 msg = "Failed to extract passkey enrollment state"
                 raise EngieBeApiClientAuthenticationError(msg)
 
             LOGGER.debug("Auth step 9 complete: got passKeyState")
 
-            # Step 10: GET /u/passkey-enrollment (load passkey page)
+            # Step 10: GET /u/passkey-enrollment (load passkey page).
+            # Steps 10 and 11 must stay sequential even though the abort
+            # POST reuses passKeyState rather than a token from this
+            # page: Auth0 only accepts the prompt submission once the
+            # page render has advanced the transaction and refreshed its
+            # cookies, and both requests share one keep-alive connection
+            # to the same host, so running them concurrently would only
+            # race the server-side state machine.
             await self._api_wrapper(
                 session=session,
                 method="GET",
@@ -1137,6 +1239,7 @@ class EngieBeApiClient:
                 params={"state": passkey_state, "ui_locales": "nl"},
                 headers=_BROWSER_HEADERS,
                 allow_redirects=False,
+                discard_body=True,
             )
             LOGGER.debug("Auth step 10 complete: loaded passkey page")
 
@@ -1156,6 +1259,7 @@ class EngieBeApiClient:
                     "action": "abort-passkey-enrollment",
                 },
                 allow_redirects=False,
+                discard_body=True,
             )
             LOGGER.debug("Auth step 11 complete: passkey enrollment aborted")
 
@@ -1173,12 +1277,12 @@ class EngieBeApiClient:
                 allow_redirects=False,
                 include_headers=True,
             )
-            auth_code = _extract_from_body(body, r"code=([a-zA-Z0-9_-]+)")
+            auth_code = _extract_from_body(body, "code=")
             if auth_code:
                 LOGGER.debug("Auth step 12 complete: got authorization code from body")
             else:
                 location = resp_headers.get("Location", "")
-                auth_code = _extract_from_body(location, r"code=([a-zA-Z0-9_-]+)")
+                auth_code = _extract_from_body(location, "code=")
                 if auth_code:
                     LOGGER.debug(
                         "Auth step 12 complete: got authorization code from "
@@ -1193,11 +1297,7 @@ class EngieBeApiClient:
             session=session,
             method="POST",
             url=f"{AUTH_BASE_URL}/oauth/token",
-            headers={
-                "Accept": "application/json",
-                "Content-Type": "application/x-www-form-urlencoded",
-                "User-Agent": USER_AGENT_NATIVE,
-            },
+            headers=_TOKEN_HEADERS,
             data={
                 "code": auth_code,
                 "grant_type": "authorization_code",
@@ -1304,6 +1404,7 @@ class EngieBeApiClient:
                 "action": "pick-authenticator",
             },
             allow_redirects=False,
+            discard_body=True,
         )
         LOGGER.debug("Auth ALT-1 complete: picked authenticator")
 
@@ -1315,6 +1416,7 @@ class EngieBeApiClient:
             params={"state": challenge_state, "ui_locales": "nl"},
             headers=_BROWSER_HEADERS,
             allow_redirects=False,
+            discard_body=True,
         )
         LOGGER.debug("Auth ALT-2 complete: loaded login options")
 
@@ -1330,6 +1432,7 @@ class EngieBeApiClient:
                 "action": "email::1",
             },
             allow_redirects=False,
+            discard_body=True,
         )
         LOGGER.debug("Auth ALT-3 complete: selected email MFA")
 
@@ -1341,6 +1444,7 @@ class EngieBeApiClient:
             params={"state": challenge_state, "ui_locales": "nl"},
             headers=_BROWSER_HEADERS,
             allow_redirects=False,
+            discard_body=True,
         )
         LOGGER.debug("Auth ALT-4 complete: email challenge triggered")
 
@@ -1360,14 +1464,20 @@ class EngieBeApiClient:
         ``extra`` to merge per-endpoint headers (e.g.
         ``Content-Type: application/json`` on POST bodies). Auth-flow methods use
         custom header dicts and do not go through this helper.
+
+        Without ``extra`` the returned dict is cached per User-Agent until
+        the access token rotates and is shared between calls, so callers
+        must not mutate it.
         """
-        headers = {
-            "User-Agent": user_agent,
-            "Accept": "application/json, application/problem+json",
-            "authorization": f"Bearer {self.access_token}",
-        }
+        headers = self._auth_headers.get(user_agent)
+        if headers is None:
+            headers = self._auth_headers[user_agent] = {
+                "User-Agent": user_agent,
+                "Accept": "application/json, application/problem+json",
+                "authorization": f"Bearer {self.access_token}",
+            }
         if extra:
-            headers.update(extra)
+            return {**headers, **extra}
         return headers
 
     # ------------------------------------------------------------------
@@ -1389,6 +1499,7 @@ class EngieBeApiClient:
         allow_redirects: bool = False,
         raise_on_error: bool = True,
         include_headers: Literal[False] = False,
+        discard_body: bool = False,
     ) -> dict[str, Any]: ...
 
     @overload
@@ -1406,6 +1517,7 @@ class EngieBeApiClient:
         allow_redirects: bool = False,
         raise_on_error: bool = True,
         include_headers: Literal[True],
+        discard_body: bool = False,
     ) -> tuple[str, dict[str, str]]: ...
 
     @overload
@@ -1423,6 +1535,7 @@ class EngieBeApiClient:
         allow_redirects: bool = False,
         raise_on_error: bool = True,
         include_headers: Literal[False] = False,
+        discard_body: bool = False,
     ) -> str: ...
 
     async def _api_wrapper(  # noqa: PLR0912, PLR0913
@@ -1439,6 +1552,7 @@ class EngieBeApiClient:
         allow_redirects: bool = False,
         raise_on_error: bool = True,
         include_headers: bool = False,
+        discard_body: bool = False,
     ) -> Any:
         """
         Execute an HTTP request with error handling.
@@ -1450,6 +1564,12 @@ class EngieBeApiClient:
         When *include_headers* is ``True`` the return value is a tuple
         of ``(body_or_json, response_headers)`` instead of just the body.
 
+        When *discard_body* is ``True`` the caller ignores the (HTML)
+        body, so it is drained as raw bytes without decoding and ``""`` is
+        returned. The body is still read in full so the keep-alive
+        connection goes back to the pool; at ``DEBUG`` it is decoded as
+        usual so the ``←`` line keeps its preview.
+
         At ``DEBUG`` log level this emits one ``→`` line before the
         request and one ``←`` (success) or ``✗`` (error) line after,
         correlated by an 8-char ``req_id``.  Tokens, credentials, OAuth
@@ -1468,51 +1588,42 @@ class EngieBeApiClient:
             )
 
         try:
-            async with asyncio.timeout(30):
-                response = await session.request(
-                    method=method,
-                    url=url,
-                    headers=headers,
-                    data=data,
-                    json=json_body,
-                    params=params,
-                    allow_redirects=allow_redirects,
-                )
-                if raise_on_error:
-                    if response.status in (
-                        HTTPStatus.UNAUTHORIZED,
-                        HTTPStatus.FORBIDDEN,
-                    ):
-                        if ctx is not None:
-                            self._req_logger.error(ctx, status=response.status)
-                        _raise_auth_error(response.status)
-
-                    # For auth-flow HTML pages, non-200/302 is likely an
-                    # error but we don't raise_for_status on 3xx since we
-                    # handle redirects manually.
-                    if response.status >= HTTPStatus.BAD_REQUEST:
-                        if ctx is not None:
-                            self._req_logger.error(ctx, status=response.status)
-                        response.raise_for_status()
-
-                if json_response:
-                    result = await response.json()
-                else:
-                    result = await response.text()
-
-                if ctx is not None:
-                    resp_ct = (
-                        response.headers.get("Content-Type")
-                        if hasattr(response, "headers")
-                        else None
-                    )
-                    self._req_logger.response(
-                        ctx, status=response.status, ct=resp_ct, body=result
-                    )
-
-                if include_headers:
-                    return result, dict(response.headers)
-                return result
+            response = await session.request(
+                method=method,
+                url=url,
+                headers=headers,
+                data=data,
+                json=json_body,
+                params=params,
+                allow_redirects=allow_redirects,
+                timeout=_REQUEST_TIMEOUT,
+            )
+            if raise_on_error:
+                if response.status in (
+                    HTTPStatus.UNAUTHORIZED,
+                    HTTPStatus.FORBIDDEN,
+                ):
+                    if ctx is not None:
+                        self._req_logger.error(ctx, status=response.status)
+                    _raise_auth_error(response.status)
+
+                # For auth-flow HTML pages, non-200/302 is likely an
+                # error but we don't raise_for_status on 3xx since we
+                # handle redirects manually.
+                if response.status >= HTTPStatus.BAD_REQUEST:
+                    if ctx is not None:
+                        self._req_logger.error(ctx, status=response.status)
+                    response.raise_for_status()
+
+            if json_response:
+                # Home Assistant's orjson-backed loader instead of aiohttp's
+                # stdlib ``json.loads`` default.
+                result = await response.json(loads=json_loads)
+            elif discard_body and ctx is None:
+                await response.read()
+                result = ""
+            else:
+                result = await response.text()
 
         except EngieBeApiClientError:
             raise
@@ -1523,20 +1634,35 @@ class EngieBeApiClient:
                 f"Timeout communicating with Engie API ({exception.__class__.__name__})"
             )
             raise EngieBeApiClientCommunicationError(msg) from exception
-        except (aiohttp.ClientError, socket.gaierror) as exception:
+        except (aiohttp.ClientError, OSError) as exception:
+            # ``OSError`` covers DNS failures (``socket.gaierror``) and raw
+            # connection/SSL errors aiohttp does not wrap in ClientError.
             if ctx is not None:
                 self._req_logger.error(  # noqa: TRY400
                     ctx, exc_name=exception.__class__.__name__
                 )
             msg = f"Error communicating with Engie API ({exception.__class__.__name__})"
             raise EngieBeApiClientCommunicationError(msg) from exception
-        except Exception as exception:
+        except ValueError as exception:
+            # Malformed JSON or an undecodable body. Anything else is a
+            # programming error and propagates with its real type.
             if ctx is not None:
                 self._req_logger.error(  # noqa: G201
                     ctx, exc_name=exception.__class__.__name__, exc_info=True
                 )
-            msg = (
-                "Unexpected error communicating with Engie API "
-                f"({exception.__class__.__name__})"
-            )
+            msg = f"Invalid response from Engie API ({exception.__class__.__name__})"
             raise EngieBeApiClientError(msg) from exception
+
+        if ctx is not None:
+            resp_ct = (
+                response.headers.get("Content-Type")
+                if hasattr(response, "headers")
+                else None
+            )
+            self._req_logger.response(
+                ctx, status=response.status, ct=resp_ct, body=result
+            )
+
+        if include_headers:
+            return result, dict(response.headers)
+        return result
@@ -218,6 +218,10 @@ class EngieBeAuthSensor(EngieBeAuthEntity, BinarySensorEntity):
         """Initialise the authentication binary sensor."""
         super().__init__(coordinator, entry)
         self._attr_unique_id = f"{entry.entry_id}_authentication"
+        # ``runtime_data`` is assigned once per setup and entities are
+        # rebuilt on reload, so holding the reference is safe and keeps
+        # ``is_on`` to a single attribute read.
+        self._runtime = entry.runtime_data
 
     async def async_added_to_hass(self) -> None:
         """Subscribe to login-scoped auth-state changes."""
@@ -240,7 +244,7 @@ class EngieBeAuthSensor(EngieBeAuthEntity, BinarySensorEntity):
     @property
     def is_on(self) -> bool:
         """Return True if the integration is currently authenticated."""
-        return self._entry.runtime_data.authenticated
+        return self._runtime.authenticated
 
 
 class EngieBeEpexNegativeSensor(
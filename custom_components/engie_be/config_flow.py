@@ -65,6 +65,45 @@ from .const import (
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
+# Static form schemas, built once at import instead of on every render.
+# Per-render values (previous input, the stored MFA method) are layered on
+# with ``add_suggested_values_to_schema``.
+_MFA_METHOD_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=[
+            selector.SelectOptionDict(value=MFA_METHOD_SMS, label="SMS"),
+            selector.SelectOptionDict(value=MFA_METHOD_EMAIL, label="Email"),
+        ],
+        mode=selector.SelectSelectorMode.DROPDOWN,
+    ),
+)
+
+_MFA_METHOD_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_MFA_METHOD, default=MFA_METHOD_SMS): _MFA_METHOD_SELECTOR,
+    },
+)
+
+_USER_STEP_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_USERNAME): selector.TextSelector(
+            selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT),
+        ),
+        vol.Required(CONF_PASSWORD): selector.TextSelector(
+            selector.TextSelectorConfig(type=selector.TextSelectorType.PASSWORD),
+        ),
+        vol.Required(CONF_MFA_METHOD, default=MFA_METHOD_SMS): _MFA_METHOD_SELECTOR,
+    },
+)
+
+_MFA_CODE_SCHEMA = vol.Schema(
+    {
+        vol.Required("code"): selector.TextSelector(
+            selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT),
+        ),
+    },
+)
+
 
 class EngieBeFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle the config flow for ENGIE Belgium."""
@@ -120,11 +159,13 @@ class EngieBeFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             self._user_input = user_input
+            username = user_input[CONF_USERNAME]
+            mfa_method = user_input.get(CONF_MFA_METHOD, MFA_METHOD_SMS)
 
             # Abort BEFORE the MFA round-trip if this login is already
             # configured. The MFA-time check in `_handle_mfa_step` stays as
             # defense-in-depth but should never be reached for duplicates now.
-            await self.async_set_unique_id(slugify(user_input[CONF_USERNAME]))
+            await self.async_set_unique_id(slugify(username))
             self._abort_if_unique_id_configured()
 
             try:
@@ -133,9 +174,9 @@ class EngieBeFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                     client_id=DEFAULT_CLIENT_ID,
                 )
                 self._auth_flow_state = await self._client.async_start_authentication(
-                    username=user_input[CONF_USERNAME],
+                    username=username,
                     password=user_input[CONF_PASSWORD],
-                    mfa_method=user_input.get(CONF_MFA_METHOD, MFA_METHOD_SMS),
+                    mfa_method=mfa_method,
                 )
             except EngieBeApiClientAuthenticationError as exception:
                 LOGGER.warning(exception)
@@ -147,49 +188,23 @@ class EngieBeFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                 LOGGER.exception(exception)
                 errors["base"] = "unknown"
             else:
-                mfa_method = user_input.get(CONF_MFA_METHOD, MFA_METHOD_SMS)
                 if mfa_method == MFA_METHOD_EMAIL:
                     return await self.async_step_mfa_email()
                 return await self.async_step_mfa_sms()
 
+        # Re-fill username and MFA method on redisplay, never the password.
+        previous = user_input or {}
         return self.async_show_form(
             step_id="user",
             description_placeholders={
                 "user_management_url": "https://www.engie.be/nl/energiedesk/usermanagement/manage-access/",
             },
-            data_schema=vol.Schema(
+            data_schema=self.add_suggested_values_to_schema(
+                _USER_STEP_SCHEMA,
                 {
-                    vol.Required(
-                        CONF_USERNAME,
-                        default=(user_input or {}).get(CONF_USERNAME, vol.UNDEFINED),
-                    ): selector.TextSelector(
-                        selector.TextSelectorConfig(
-                            type=selector.TextSelectorType.TEXT,
-                        ),
-                    ),
-                    vol.Required(CONF_PASSWORD): selector.TextSelector(
-                        selector.TextSelectorConfig(
-                            type=selector.TextSelectorType.PASSWORD,
-                        ),
-                    ),
-                    vol.Required(
-                        CONF_MFA_METHOD,
-                        default=(user_input or {}).get(CONF_MFA_METHOD, MFA_METHOD_SMS),
-                    ): selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=[
-                                selector.SelectOptionDict(
-                                    value=MFA_METHOD_SMS,
-                                    label="SMS",
-                                ),
-                                selector.SelectOptionDict(
-                                    value=MFA_METHOD_EMAIL,
-                                    label="Email",
-                                ),
-                            ],
-                            mode=selector.SelectSelectorMode.DROPDOWN,
-                        ),
-                    ),
+                    key: previous[key]
+                    for key in (CONF_USERNAME, CONF_MFA_METHOD)
+                    if key in previous
                 },
             ),
             errors=errors,
@@ -262,8 +277,9 @@ class EngieBeFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                 LOGGER.exception(exception)
                 errors["base"] = "unknown"
             else:
-                username = self._user_input[CONF_USERNAME]
-                await self.async_set_unique_id(slugify(username))
+                # Re-assert the unique id slugified in the user step; the
+                # username cannot change between the two steps.
+                await self.async_set_unique_id(self.unique_id)
                 self._abort_if_unique_id_configured()
 
                 # Stash the freshly-issued tokens for the picker step,
@@ -277,15 +293,7 @@ class EngieBeFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id=step_id,
-            data_schema=vol.Schema(
-                {
-                    vol.Required("code"): selector.TextSelector(
-                        selector.TextSelectorConfig(
-                            type=selector.TextSelectorType.TEXT,
-                        ),
-                    ),
-                },
-            ),
+            data_schema=_MFA_CODE_SCHEMA,
             errors=errors,
         )
 
@@ -599,27 +607,9 @@ class EngieBeFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             description_placeholders={
                 "username": entry.data.get(CONF_USERNAME, ""),
             },
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_MFA_METHOD,
-                        default=entry.data.get(CONF_MFA_METHOD, MFA_METHOD_SMS),
-                    ): selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=[
-                                selector.SelectOptionDict(
-                                    value=MFA_METHOD_SMS,
-                                    label="SMS",
-                                ),
-                                selector.SelectOptionDict(
-                                    value=MFA_METHOD_EMAIL,
-                                    label="Email",
-                                ),
-                            ],
-                            mode=selector.SelectSelectorMode.DROPDOWN,
-                        ),
-                    ),
-                },
+            data_schema=self.add_suggested_values_to_schema(
+                _MFA_METHOD_SCHEMA,
+                {CONF_MFA_METHOD: entry.data.get(CONF_MFA_METHOD, MFA_METHOD_SMS)},
             ),
             errors=errors,
         )
@@ -672,27 +662,9 @@ class EngieBeFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         return self.async_show_form(
             step_id="reauth_confirm",
             description_placeholders={"username": entry.data.get(CONF_USERNAME, "")},
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_MFA_METHOD,
-                        default=self._reauth_mfa_method,
-                    ): selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=[
-                                selector.SelectOptionDict(
-                                    value=MFA_METHOD_SMS,
-                                    label="SMS",
-                                ),
-                                selector.SelectOptionDict(
-                                    value=MFA_METHOD_EMAIL,
-                                    label="Email",
-                                ),
-                            ],
-                            mode=selector.SelectSelectorMode.DROPDOWN,
-                        ),
-                    ),
-                },
+            data_schema=self.add_suggested_values_to_schema(
+                _MFA_METHOD_SCHEMA,
+                {CONF_MFA_METHOD: self._reauth_mfa_method},
             ),
             errors=errors,
         )
@@ -748,15 +720,7 @@ class EngieBeFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="reauth_mfa",
-            data_schema=vol.Schema(
-                {
-                    vol.Required("code"): selector.TextSelector(
-                        selector.TextSelectorConfig(
-                            type=selector.TextSelectorType.TEXT,
-                        ),
-                    ),
-                },
-            ),
+            data_schema=_MFA_CODE_SCHEMA,
             errors=errors,
         )
 
@@ -172,8 +172,19 @@ USER_AGENT_BROWSER = (
 )
 USER_AGENT_NATIVE = "Dalvik/2.1.0 (Linux; U; Android 16; Pixel 6 Build/BP4A.251205.006)"
 
-# Token refresh interval in seconds (access token valid ~2 min, refresh every 1 min)
+# Token refresh scheduling. The next refresh fires MARGIN seconds before the
+# access token's JWT ``exp`` claim, but never sooner than MIN_DELAY seconds
+# out. INTERVAL is the fallback when the token carries no readable ``exp``
+# and the retry delay after a failed refresh (access token valid ~2 min).
 TOKEN_REFRESH_INTERVAL_SECONDS = 60
+TOKEN_REFRESH_MARGIN_SECONDS = 60
+TOKEN_REFRESH_MIN_DELAY_SECONDS = 30
+# A persisted access token is reused at setup, instead of being refreshed on
+# the startup critical path, when the scheduled refresh (MARGIN before ``exp``,
+# at least MIN_DELAY out) can still rotate it before it expires.
+TOKEN_REUSE_MIN_VALIDITY_SECONDS = (
+    TOKEN_REFRESH_MARGIN_SECONDS + TOKEN_REFRESH_MIN_DELAY_SECONDS
+)
 
 # Dispatcher signal format for login-scoped authentication state changes.
 SIGNAL_AUTHENTICATION_STATE_CHANGED = (
@@ -210,6 +221,12 @@ EPEX_MWH_TO_KWH = 1000.0
 # Coordinator payload key for the dynamic-tariff flag (kept namespaced
 # to avoid clashing with future ENGIE response fields).
 KEY_IS_DYNAMIC = "is_dynamic"
+# Coordinator payload key for the per-refresh ``ean -> parsed prices``
+# index built from ``items`` (see ``_prices.parse_price_items``).
+KEY_PRICES_BY_EAN = "prices_by_ean"
+# Coordinator payload key for the Brussels date ordinal the refresh ran
+# on; price sensors pick their current window against it.
+KEY_PRICES_DATE = "prices_date"
 
 # Energy-contracts product codes that identify a dynamic (EPEX-indexed)
 # tariff. The API returns ``productConfiguration.energyProduct`` per
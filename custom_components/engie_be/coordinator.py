@@ -17,6 +17,7 @@ from homeassistant.util import dt as dt_util
 
 from ._contracts import ean_with_delivery_point_suffix
 from ._happy_hour import happy_hour_flag_reason, is_enrolled_from_flag
+from ._prices import parse_price_items
 from ._relations import (
     RELATIONS_BACKFILLABLE_KEYS,
     find_agreement_for_ban,
@@ -39,6 +40,8 @@ from .const import (
     EPEX_DEFAULT_SLOT_DURATION_MINUTES,
     EPEX_MWH_TO_KWH,
     KEY_IS_DYNAMIC,
+    KEY_PRICES_BY_EAN,
+    KEY_PRICES_DATE,
     LOGGER,
     EpexGranularity,
 )
@@ -96,6 +99,9 @@ class EngieBeDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.business_agreement_number: str = subentry.data[
             CONF_BUSINESS_AGREEMENT_NUMBER
         ]
+        # The BAN never changes for the lifetime of the coordinator, so
+        # mask it once for log lines instead of on every poll.
+        self._ban_masked: str = mask_identifier(self.business_agreement_number)
         self.last_successful_fetch: datetime | None = None
         # One-shot backfill: when the subentry was created without all
         # relations-derived display fields, we attempt to populate them
@@ -178,8 +184,13 @@ class EngieBeDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # falls back to this value when the contracts call failed.
         items = data.get("items") if isinstance(data, dict) else None
         is_dynamic = isinstance(items, list) and len(items) == 0
+        # Brussels "now" for this refresh, shared by the price-window
+        # stamp below and the captar month selection further down.
+        today = dt_util.now(BRUSSELS_TZ)
         if isinstance(data, dict):
             data[KEY_IS_DYNAMIC] = is_dynamic
+            data[KEY_PRICES_BY_EAN] = parse_price_items(items)
+            data[KEY_PRICES_DATE] = today.date().toordinal()
 
         # One-shot backfill of relations-derived display fields. Runs
         # only when the subentry is missing at least one such field.
@@ -196,8 +207,6 @@ class EngieBeDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # the first day or two of a new month before ENGIE has recorded a
         # 15-minute interval), we fall back to the previous month so users
         # still see a meaningful value.
-        today = dt_util.now(BRUSSELS_TZ)
-
         previous_peaks_wrapper: dict[str, Any] | None = None
         if isinstance(self.data, dict):
             existing = self.data.get("peaks")
@@ -408,7 +417,7 @@ class EngieBeDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             LOGGER.debug(
                 "BAN %s: expose_all_entities is ON, forcing flags: "
                 "enrolled=%s, solar=%s, tou=%s",
-                mask_identifier(business_agreement_number),
+                self._ban_masked,
                 new_enrolled,
                 solar_shown,
                 tou_active,
@@ -453,7 +462,7 @@ class EngieBeDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             LOGGER.warning(
                 "Failed to fetch feature flags for BAN %s, "
                 "keeping last-known Happy Hours enrolment (%s): %s",
-                mask_identifier(business_agreement_number),
+                self._ban_masked,
                 previous_enrolled,
                 exception,
             )
@@ -463,7 +472,7 @@ class EngieBeDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         reason = happy_hour_flag_reason(flags)
         LOGGER.debug(
             "BAN %s: Happy Hours enrolment from feature flags is %s (reason=%s)",
-            mask_identifier(business_agreement_number),
+            self._ban_masked,
             enrolled,
             reason,
         )
@@ -514,14 +523,14 @@ class EngieBeDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 "Failed to fetch %s feature flag for BAN %s, "
                 "assuming enabled and continuing: %s",
                 log_prefix,
-                mask_identifier(business_agreement_number),
+                self._ban_masked,
                 exception,
             )
             return True
         value = flags.get("value") if isinstance(flags, dict) else None
         LOGGER.debug(
             "BAN %s: %s feature flag is %s",
-            mask_identifier(business_agreement_number),
+            self._ban_masked,
             log_prefix,
             value,
         )
@@ -609,7 +618,7 @@ class EngieBeDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if not electricity_eans:
             return previous_wrapper
 
-        ban_masked = mask_identifier(business_agreement_number)
+        ban_masked = self._ban_masked
         previous_data = (
             previous_wrapper.get("data") if isinstance(previous_wrapper, dict) else None
         )
@@ -714,7 +723,7 @@ class EngieBeDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             LOGGER.debug(
                 "BAN %s: initial %s state observed as %s; "
                 "platforms will register accordingly",
-                mask_identifier(self.business_agreement_number),
+                self._ban_masked,
                 log_prefix,
                 new,
             )
@@ -729,7 +738,7 @@ class EngieBeDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "%s changed for BAN %s (%s -> %s); "
             "reloading config entry to reconcile entities",
             log_prefix,
-            mask_identifier(self.business_agreement_number),
+            self._ban_masked,
             previous,
             new,
         )
@@ -805,7 +814,7 @@ class EngieBeDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         on success, or ``previous_wrapper`` on transient failure. Auth
         errors escalate to reauth.
         """
-        ban_masked = mask_identifier(business_agreement_number)
+        ban_masked = self._ban_masked
         try:
             payload = await client.async_get_tou_schedules(business_agreement_number)
         except EngieBeApiClientAuthenticationError as exception:
@@ -863,7 +872,7 @@ class EngieBeDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         unchanged (so sensors keep their last-known values). Auth errors
         escalate to reauth.
         """
-        ban_masked = mask_identifier(business_agreement_number)
+        ban_masked = self._ban_masked
         try:
             payload = await client.async_get_account_balance(business_agreement_number)
         except EngieBeApiClientAuthenticationError as exception:
@@ -941,7 +950,7 @@ class EngieBeDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return previous_wrapper
 
         wrapper = {"data": payload if isinstance(payload, dict) else None}
-        ban_masked = mask_identifier(business_agreement_number)
+        ban_masked = self._ban_masked
         if isinstance(payload, dict):
             scheduled = {
                 key: payload[key]
@@ -1019,7 +1028,7 @@ class EngieBeDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             LOGGER.warning(
                 "Failed to fetch Happy Hours month report for BAN %s, "
                 "keeping last-known value: %s",
-                mask_identifier(business_agreement_number),
+                self._ban_masked,
                 exception,
             )
             if previous_wrapper is None:
@@ -1032,7 +1041,7 @@ class EngieBeDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 "is_fallback": True,
             }
 
-        ban_masked = mask_identifier(business_agreement_number)
+        ban_masked = self._ban_masked
 
         if not isinstance(payload, dict):
             LOGGER.debug(
@@ -1150,7 +1159,7 @@ class EngieBeDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         both keys) between announcement and expiry, but the store dedups
         on ``start``.
         """
-        ban = mask_identifier(self.business_agreement_number)
+        ban = self._ban_masked
         payload = happy_hour_wrapper.get("data")
         if not isinstance(payload, dict):
             LOGGER.debug(
@@ -1248,7 +1257,7 @@ class EngieBeDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             LOGGER.debug(
                 "Relations response has no entry for BAN %s; "
                 "leaving subentry %s untouched",
-                mask_identifier(self.business_agreement_number),
+                self._ban_masked,
                 self.subentry.subentry_id,
             )
             return
@@ -10,6 +10,7 @@ if TYPE_CHECKING:
     from collections.abc import Callable
 
     from homeassistant.config_entries import ConfigEntry
+    from homeassistant.helpers.device_registry import DeviceInfo
     from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
     from .api import EngieBeApiClient
@@ -77,6 +78,51 @@ class EpexPayload:
     slot_duration: timedelta = timedelta(minutes=60)
 
 
+@dataclass(slots=True, frozen=True)
+class EnergyPrice:
+    """
+    One supplier price window for a single EAN, parsed once per refresh.
+
+    ``from_ord``/``to_ord`` are the date ordinals of the window's
+    ``from``/``to`` bounds, or ``None`` when either is missing or
+    unparseable (such an entry can only be picked as the last-entry
+    fallback). ``valid_from``, ``valid_to`` and ``vat_tariff`` keep the
+    raw API values for the state attributes. ``rates`` maps
+    ``(direction, timeOfUseSlotCode, field)`` to the field's value as a
+    float; fields that are missing, ``None`` or non-numeric are absent.
+    ``slots`` lists each direction's ``timeOfUseSlotCode`` values in API
+    order, including slots whose prices are currently missing, so the
+    sensor platform creates entities from the same entry it later reads.
+    """
+
+    from_ord: int | None
+    to_ord: int | None
+    valid_from: Any
+    valid_to: Any
+    vat_tariff: Any
+    rates: dict[tuple[str, str, str], float]
+    slots: dict[str, tuple[str, ...]]
+
+
+@dataclass(slots=True, frozen=True)
+class EnergyPrices:
+    """
+    Parsed price windows for a single EAN.
+
+    ``windows`` holds the entries with valid bounds sorted by
+    ``from_ord``, and ``from_ords`` mirrors their start ordinals for
+    bisection. ``fallback`` is the last entry in API order (valid or
+    not), used when no window covers the requested date. When any two
+    windows overlap, ``overlapping`` is set and ``windows`` keeps API
+    order instead, so the lookup scans for the first covering window.
+    """
+
+    windows: tuple[EnergyPrice, ...]
+    from_ords: tuple[int, ...]
+    fallback: EnergyPrice | None
+    overlapping: bool
+
+
 @dataclass(frozen=False)
 class FeatureFlagState:
     """
@@ -134,6 +180,11 @@ class EngieBeSubentryData:
     accounts at first observation; the store is created up front so
     enrolment that flips on later can start recording immediately
     without a second wiring pass.
+
+    ``device_info`` describes the account device and is built once at
+    setup. Every supplier, EPEX and event entity of the account attaches
+    it, so they share one instance for the lifetime of the config entry.
+    Home Assistant only reads it; nothing may mutate it.
     """
 
     coordinator: EngieBeDataUpdateCoordinator
@@ -142,10 +193,11 @@ class EngieBeSubentryData:
     happy_hours_store: EngieBeHappyHoursStore | None = field(default=None)
     is_dynamic_override: bool | None = field(default=None)
     energy_contracts_payload: dict[str, Any] | None = field(default=None)
+    device_info: DeviceInfo | None = field(default=None)
     feature_flags: FeatureFlagState = field(default_factory=FeatureFlagState)
 
 
-@dataclass
+@dataclass(slots=True)
 class EngieBeData:
     """
     Runtime data for the ENGIE Belgium integration.
@@ -174,6 +226,10 @@ class EngieBeData:
     generated by the framework's finish path and is not known up front,
     whereas the BAN (``unique_id``) is set by the picker. ``None`` means no
     multi-add is in progress.
+
+    Slotted but not frozen: ``authenticated``, the reload gates and the
+    token-refresh cancel handle are reassigned in place for the lifetime
+    of the entry.
     """
 
     client: EngieBeApiClient
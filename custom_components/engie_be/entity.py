@@ -206,6 +206,22 @@ def subentry_device_info(subentry: ConfigSubentry) -> DeviceInfo:
     )
 
 
+def account_device_info(
+    entry: EngieBeConfigEntry,
+    subentry: ConfigSubentry,
+) -> DeviceInfo:
+    """
+    Device info for a subentry, shared by every entity of the account.
+
+    Returns the instance built at setup on the subentry's runtime data,
+    and builds a fresh one when no runtime data is registered for it.
+    """
+    sub_data = entry.runtime_data.subentry_data.get(subentry.subentry_id)
+    if sub_data is None or sub_data.device_info is None:
+        return subentry_device_info(subentry)
+    return sub_data.device_info
+
+
 def login_device_info(entry: EngieBeConfigEntry) -> DeviceInfo:
     """Device info for the per-login account device of one config entry."""
     username = entry.data.get(CONF_USERNAME, "")
@@ -255,7 +271,7 @@ class EngieBeEntity(
         """Initialise the per-subentry entity."""
         super().__init__(coordinator)
         self._subentry = subentry
-        self._attr_device_info = subentry_device_info(subentry)
+        self._attr_device_info = account_device_info(coordinator.config_entry, subentry)
 
 
 class EngieBeEpexEntity(
@@ -286,7 +302,7 @@ class EngieBeEpexEntity(
         """Initialise the EPEX entity bound to a subentry's device."""
         super().__init__(coordinator)
         self._subentry = subentry
-        self._attr_device_info = subentry_device_info(subentry)
+        self._attr_device_info = account_device_info(coordinator.config_entry, subentry)
 
 
 class EngieBeAuthEntity(
@@ -37,7 +37,7 @@ from .const import (
     TRANSLATION_KEY_TOU_OFFTAKE_IS_OPTIMAL,
     TRANSLATION_KEY_TOU_OFFTAKE_SLOT,
 )
-from .entity import login_device_info, subentry_device_info
+from .entity import account_device_info, login_device_info
 
 # Coordinator centralises updates; this platform doesn't poll at all -- it
 # reacts to sibling-entity state changes instead.
@@ -345,7 +345,7 @@ class EngieBeTransitionEvent(_TransitionWatcherMixin, EventEntity):
         self._attr_unique_id = (
             f"{entry.entry_id}_{subentry.subentry_id}_{description.key}"
         )
-        self._attr_device_info = subentry_device_info(subentry)
+        self._attr_device_info = account_device_info(entry, subentry)
         self._entity_watch_map: dict[str, WatchedSibling] = {}
         ban = subentry.data.get(CONF_BUSINESS_AGREEMENT_NUMBER)
         if ban:
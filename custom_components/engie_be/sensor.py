@@ -27,6 +27,7 @@ from ._contracts import bare_ean, ean_with_delivery_point_suffix
 from ._epex import _slot_duration_minutes, epex_payload, next_epex_slot_boundary
 from ._happy_hour import happy_hour_window
 from ._peaks import peaks_meta, peaks_payload
+from ._prices import current_price
 from ._solar import (
     flat_slots,
     next_hour_boundary,
@@ -42,6 +43,8 @@ from .const import (
     BRUSSELS_TZ,
     CONF_BUSINESS_AGREEMENT_NUMBER,
     CONF_EXPOSE_ALL_ENTITIES,
+    KEY_PRICES_BY_EAN,
+    KEY_PRICES_DATE,
     LOGGER,
     SOLAR_SURPLUS_LEVELS,
     SUBENTRY_TYPE_BUSINESS_AGREEMENT,
@@ -70,7 +73,7 @@ if TYPE_CHECKING:
         EngieBeEpexCoordinatorBase,
         EngieBeEpexQuarterHourCoordinator,
     )
-    from .data import EngieBeConfigEntry, EpexPayload
+    from .data import EnergyPrice, EnergyPrices, EngieBeConfigEntry, EpexPayload
 
 
 # Mapping from service-point division to display name.
@@ -86,21 +89,6 @@ def _detect_energy_type(ean: str, service_points: dict[str, str]) -> str:
     return _DIVISION_MAP.get(division, "Energy")
 
 
-def _find_current_price(prices: list[dict[str, Any]]) -> dict[str, Any] | None:
-    """Find the price entry whose date range covers today, or the last entry."""
-    today = dt_util.now(BRUSSELS_TZ).date()
-    for price in prices:
-        try:
-            from_date = date.fromisoformat(price["from"])
-            to_date = date.fromisoformat(price["to"])
-        except KeyError, ValueError, TypeError:
-            continue
-        if from_date <= today < to_date:
-            return price
-    # Fall back to the last entry if no exact match
-    return prices[-1] if prices else None
-
-
 # Mapping from normalised rate code to (key_suffix, translation_suffix).
 # TOTAL_HOURS uses empty strings to preserve backward compatibility.
 # A ``None`` value means "skip this entry entirely" (e.g. blended rates).
@@ -145,6 +133,17 @@ def _slot_suffixes(slot_code: str) -> tuple[str, str] | None:
     return (f"_{lower}", f"_{lower}")
 
 
+_PRICE_UNIT = "EUR/kWh"
+
+# One price sensor per (field, key/translation suffix, enabled by default)
+# for every direction/slot pair. Excl-VAT prices stay disabled unless the
+# user opts into exposing all entities.
+_PRICE_FIELDS: tuple[tuple[str, str, bool], ...] = (
+    ("priceValue", "", True),
+    ("priceValueExclVAT", "_excl_vat", False),
+)
+
+
 def _build_sensor_descriptions(
     data: dict[str, Any],
     service_points: dict[str, str],
@@ -152,7 +151,7 @@ def _build_sensor_descriptions(
     expose_all: bool = False,
 ) -> list[tuple[SensorEntityDescription, str, str, str]]:
     """
-    Build sensor descriptions from the API response.
+    Build sensor descriptions from the parsed prices on the coordinator payload.
 
     Returns a list of ``(description, ean, value_key, slot_code)`` tuples where
     *value_key* is a dotted path like ``offtake.priceValue`` and *slot_code* is
@@ -160,68 +159,49 @@ def _build_sensor_descriptions(
     """
     sensors: list[tuple[SensorEntityDescription, str, str, str]] = []
 
-    for item in data.get("items", []):
-        ean: str = item.get("ean", "unknown")
+    # Resolve through the same parsed entries and refresh date the sensors
+    # read, so entities are created for exactly the slots they will find.
+    prices_by_ean: dict[str, EnergyPrices] = data.get(KEY_PRICES_BY_EAN) or {}
+    for ean, prices in prices_by_ean.items():
         # service_points is keyed by the bare EAN (see
         # _async_populate_service_points), so strip the trailing _ID*
         # suffix before using it for the lookup or any user-facing key.
         # e.g. "541448...267_ID1" -> cleaner key
         ean_short = bare_ean(ean)
-        energy_type = _detect_energy_type(ean_short, service_points)
+        energy_prefix = _detect_energy_type(ean_short, service_points).lower()
 
-        current_price = _find_current_price(item.get("prices", []))
-        if current_price is None:
+        entry = current_price(prices, data[KEY_PRICES_DATE])
+        if entry is None:
             continue
 
-        configs = current_price.get("proportionalPriceConfigurations", {})
-
-        unit = "EUR/kWh"
-
         for direction in ("offtake", "injection"):
-            direction_list: list[dict[str, Any]] = configs.get(direction, [])
-            if not direction_list:
-                continue
-
-            for slot_entry in direction_list:
-                slot_code: str = slot_entry.get("timeOfUseSlotCode", "TOTAL_HOURS")
+            for slot_code in entry.slots.get(direction, ()):
                 suffixes = _slot_suffixes(slot_code)
                 if suffixes is None:
                     continue
                 key_suffix, trans_suffix = suffixes
 
                 base_key = f"{ean_short}_{direction}{key_suffix}"
-                base_trans = f"{energy_type.lower()}_{direction}{trans_suffix}"
-
-                # Price including VAT
-                sensors.append(
-                    (
-                        SensorEntityDescription(
-                            key=base_key,
-                            translation_key=base_trans,
-                            native_unit_of_measurement=unit,
-                            state_class=SensorStateClass.MEASUREMENT,
-                            suggested_display_precision=6,
-                        ),
-                        ean,
-                        f"{direction}.priceValue",
-                        slot_code,
+                base_trans = f"{energy_prefix}_{direction}{trans_suffix}"
+
+                for field_name, field_suffix, enabled_default in _PRICE_FIELDS:
+                    sensors.append(
+                        (
+                            SensorEntityDescription(
+                                key=f"{base_key}{field_suffix}",
+                                translation_key=f"{base_trans}{field_suffix}",
+                                native_unit_of_measurement=_PRICE_UNIT,
+                                state_class=SensorStateClass.MEASUREMENT,
+                                suggested_display_precision=6,
+                                entity_registry_enabled_default=(
+                                    enabled_default or expose_all
+                                ),
+                            ),
+                            ean,
+                            f"{direction}.{field_name}",
+                            slot_code,
+                        )
                     )
-                )
-                excl_vat_desc = SensorEntityDescription(
-                    key=f"{base_key}_excl_vat",
-                    translation_key=f"{base_trans}_excl_vat",
-                    native_unit_of_measurement=unit,
-                    state_class=SensorStateClass.MEASUREMENT,
-                    suggested_display_precision=6,
-                    entity_registry_enabled_default=False,
-                )
-                if expose_all:
-                    excl_vat_desc = dataclasses.replace(
-                        excl_vat_desc, entity_registry_enabled_default=True
-                    )
-                sensors.append(
-                    (excl_vat_desc, ean, f"{direction}.priceValueExclVAT", slot_code)
-                )
 
     return sensors
 
@@ -922,8 +902,21 @@ class EngieBeEnergySensor(EngieBeEntity, SensorEntity):
         super().__init__(coordinator, subentry)
         self.entity_description = entity_description
         self._ean = ean
-        self._value_key = value_key
+        # ``value_key`` is a dotted ``direction.field`` path; resolve it
+        # once here into the ``EnergyPrice.rates`` key read on every state
+        # write.
+        direction, _, field_name = value_key.partition(".")
+        self._rate_key = (direction, slot_code, field_name)
         self._slot_code = slot_code
+        self._ean_display = bare_ean(ean)
+        # Cache: (coordinator data, price value, attributes). HA reads both
+        # ``native_value`` and ``extra_state_attributes`` on every state
+        # write; ``_async_update_data`` publishes a fresh ``data`` dict on
+        # every refresh, so an identity check resolves both once per
+        # coordinator tick.
+        self._resolved_cache: (
+            tuple[dict[str, Any] | None, float | None, dict[str, Any]] | None
+        ) = None
         # Subentry-scoped unique IDs match every other v3 customer-account
         # entity (peaks, calendar, EPEX). Energy descriptors already embed
         # the EAN, but keeping the subentry segment in the unique_id keeps
@@ -950,54 +943,41 @@ class EngieBeEnergySensor(EngieBeEntity, SensorEntity):
     @property
     def native_value(self) -> float | None:
         """Return the current price value."""
-        return self._get_price_value()
+        return self._resolved()[0]
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
-        ean_display = bare_ean(self._ean)
-        attrs: dict[str, Any] = {"ean": ean_display}
+        return self._resolved()[1]
+
+    def _resolved(self) -> tuple[float | None, dict[str, Any]]:
+        """Return the price value and attributes, memoized per refresh."""
+        data = self.coordinator.data
+        cache = self._resolved_cache
+        if cache is not None and cache[0] is data:
+            return cache[1], cache[2]
+        attrs: dict[str, Any] = {"ean": self._ean_display}
+        value: float | None = None
         price_entry = self._get_current_price_entry()
-        if price_entry:
-            attrs["from"] = price_entry.get("from")
-            attrs["to"] = price_entry.get("to")
-            attrs["vat_tariff"] = price_entry.get("vatTariff")
+        if price_entry is not None:
+            attrs["from"] = price_entry.valid_from
+            attrs["to"] = price_entry.valid_to
+            attrs["vat_tariff"] = price_entry.vat_tariff
             attrs["time_of_use_slot_code"] = self._slot_code
-        return attrs
+            value = price_entry.rates.get(self._rate_key)
+        self._resolved_cache = (data, value, attrs)
+        return value, attrs
 
-    def _get_current_price_entry(self) -> dict[str, Any] | None:
+    def _get_current_price_entry(self) -> EnergyPrice | None:
         """Find the current price entry for this sensor's EAN."""
-        if not self.coordinator.data:
-            return None
-        for item in self.coordinator.data.get("items", []):
-            if item.get("ean") == self._ean:
-                return _find_current_price(item.get("prices", []))
-        return None
-
-    def _get_price_value(self) -> float | None:
-        """Extract the specific price value from the current entry."""
-        price_entry = self._get_current_price_entry()
-        if not price_entry:
+        data = self.coordinator.data
+        if not data:
             return None
-
-        direction, field_name = self._value_key.split(".")
-        configs = price_entry.get("proportionalPriceConfigurations", {})
-        direction_list: list[dict[str, Any]] = configs.get(direction, [])
-        if not direction_list:
+        prices_by_ean = data.get(KEY_PRICES_BY_EAN)
+        prices = prices_by_ean.get(self._ean) if prices_by_ean else None
+        if prices is None:
             return None
-
-        # Find the entry matching this sensor's time-of-use slot code
-        for slot_entry in direction_list:
-            if slot_entry.get("timeOfUseSlotCode") == self._slot_code:
-                value = slot_entry.get(field_name)
-                if value is None:
-                    return None
-                try:
-                    return float(value)
-                except TypeError, ValueError:
-                    return None
-
-        return None
+        return current_price(prices, data[KEY_PRICES_DATE])
 
 
 # ---------------------------------------------------------------------------
@@ -15,8 +15,10 @@ from custom_components.engie_be.api import (
     EngieBeApiClient,
     EngieBeApiClientAuthenticationError,
     EngieBeApiClientCommunicationError,
+    EngieBeApiClientError,
     EngieBeApiClientMfaError,
     _base64url,
+    _extract_from_body,
     _generate_pkce,
 )
 from custom_components.engie_be.const import MFA_METHOD_EMAIL, MFA_METHOD_SMS
@@ -100,6 +102,17 @@ def test_generate_pkce_returns_distinct_well_formed_values() -> None:
     assert _generate_pkce()[0] != state
 
 
+def test_extract_from_body_skips_anchor_without_token() -> None:
+    """A bare ``state=`` with no token does not hide a later valid one."""
+    body = "<a href='?state='></a><form action='/u/x?state=abc_-9'></form>"
+    assert _extract_from_body(body, "state=") == "abc_-9"
+
+
+def test_extract_from_body_returns_none_without_anchor() -> None:
+    """Bodies that never mention the anchor yield ``None``."""
+    assert _extract_from_body("<html></html>", "code=") is None
+
+
 # ---------------------------------------------------------------------------
 # async_refresh_token edge branches
 # ---------------------------------------------------------------------------
@@ -209,6 +222,31 @@ async def test_refresh_token_concurrent_callers_issue_single_request() -> None:
     assert client.refresh_token == "v1.rotated"  # noqa: S105
 
 
+async def test_refresh_token_response_without_tokens_raises_api_error() -> None:
+    """A 2xx missing the token pair is an API error and keeps the old tokens."""
+    client = _make_client()
+    client._api_wrapper = AsyncMock(return_value={"expires_in": 120})  # type: ignore[method-assign]
+
+    with pytest.raises(EngieBeApiClientError, match="missing the token pair"):
+        await client.async_refresh_token()
+
+    assert client.refresh_token == "v0.original"  # noqa: S105
+
+
+async def test_api_wrapper_maps_raw_os_error_to_communication_error() -> None:
+    """A connection error aiohttp did not wrap is still a communication error."""
+    session = MagicMock()
+    session.request = AsyncMock(side_effect=ConnectionResetError("reset"))
+    client = EngieBeApiClient(
+        session=session,
+        client_id="client-1",
+        refresh_token="v0.x",  # noqa: S106
+    )
+
+    with pytest.raises(EngieBeApiClientCommunicationError, match="ConnectionReset"):
+        await client.async_refresh_token()
+
+
 # ---------------------------------------------------------------------------
 # async_start_authentication (steps 1-7 orchestration + session lifecycle)
 # ---------------------------------------------------------------------------
@@ -225,13 +263,17 @@ async def test_start_authentication_returns_flow_state_on_success() -> None:
     with patch(
         "custom_components.engie_be.api.aiohttp.ClientSession",
         return_value=fake_session,
-    ):
+    ) as session_cls:
         result = await client.async_start_authentication(_USERNAME, _PASSWORD)
 
     assert result is flow
     fake_session.close.assert_not_awaited()
     # The freshly created session is threaded into steps 1-7.
     assert client._run_auth_steps_1_to_7.await_args.args[0] is fake_session
+    # It borrows the shared session's connector without taking ownership.
+    session_kwargs = session_cls.call_args.kwargs
+    assert session_kwargs["connector"] is client._session.connector
+    assert session_kwargs["connector_owner"] is False
 
 
 async def test_start_authentication_closes_session_on_failure() -> None:
@@ -163,3 +163,34 @@ async def test_happy_hours_flag_strips_ban_whitespace() -> None:
 
     body = mocked.await_args.kwargs["json_body"]
     assert body["additionalContext"]["contractAccountId"] == _BAN
+
+
+# ---------------------------------------------------------------------------
+# _authenticated_headers caching
+# ---------------------------------------------------------------------------
+
+
+def test_authenticated_headers_rebuilt_after_token_rotation() -> None:
+    """Headers are reused within a token's lifetime and rebuilt on rotation."""
+    client = _build_client()
+
+    first = client._authenticated_headers()
+    assert client._authenticated_headers() is first
+    assert first["authorization"] == "Bearer test-access-token"
+
+    client.access_token = "rotated-token"  # noqa: S105
+    rotated = client._authenticated_headers()
+    assert rotated is not first
+    assert rotated["authorization"] == "Bearer rotated-token"
+
+
+def test_authenticated_headers_extra_does_not_touch_cached_dict() -> None:
+    """Merging ``extra`` returns a fresh dict and leaves the cache intact."""
+    client = _build_client()
+
+    merged = client._authenticated_headers(extra={"Content-Type": "application/json"})
+    plain = client._authenticated_headers()
+
+    assert merged["Content-Type"] == "application/json"
+    assert "Content-Type" not in plain
+    assert plain["User-Agent"] == USER_AGENT_NATIVE
@@ -40,6 +40,7 @@ from custom_components.engie_be.api import (
     EngieBeApiClient,
     EngieBeApiClientAuthenticationError,
     EngieBeApiClientCommunicationError,
+    EngieBeApiClientError,
     EpexNotPublishedError,
 )
 
@@ -687,19 +688,20 @@ async def test_api_wrapper_no_debug_lines_when_level_off(
     assert _arrows_for(caplog.records) == []
 
 
-async def test_api_wrapper_unexpected_exception_logs_with_exc_info(
+async def test_api_wrapper_invalid_response_logs_with_exc_info(
     caplog: pytest.LogCaptureFixture,
 ) -> None:
     """
-    The bare-``Exception`` branch in ``_api_wrapper`` attaches a stack trace.
+    The ``ValueError`` branch in ``_api_wrapper`` attaches a stack trace.
 
-    Triggers an unexpected exception type (``RuntimeError``) from
-    ``session.request`` so the catch-all branch fires; asserts the
+    Makes ``response.json()`` raise a ``ValueError`` (what a malformed
+    JSON body produces) so the invalid-response branch fires; asserts the
     emitted DEBUG record carries ``exc_info`` (i.e. a traceback is
     rendered for operator debugging).
     """
-    session = MagicMock()
-    session.request = AsyncMock(side_effect=RuntimeError("kaboom"))
+    response = _make_response(status=200, json_body={})
+    response.json = AsyncMock(side_effect=ValueError("bad json"))
+    session = _make_session(response)
     client = EngieBeApiClient(
         session=session,
         client_id="client-1",
@@ -708,20 +710,34 @@ async def test_api_wrapper_unexpected_exception_logs_with_exc_info(
 
     with (
         caplog.at_level(logging.DEBUG, logger=_LOGGER_NAME),
-        pytest.raises(Exception, match="Unexpected error communicating"),
+        pytest.raises(EngieBeApiClientError, match="Invalid response from Engie"),
     ):
         await client.async_refresh_token()
 
     error_records = [
         r
         for r in caplog.records
-        if r.getMessage().startswith("✗") and "RuntimeError" in r.getMessage()
+        if r.getMessage().startswith("✗") and "ValueError" in r.getMessage()
     ]
-    assert error_records, "expected ✗ DEBUG record for the unexpected branch"
+    assert error_records, "expected ✗ DEBUG record for the invalid-response branch"
     assert error_records[0].exc_info is not None, (
-        "bare-Exception branch must pass exc_info=True so the traceback is logged"
+        "ValueError branch must pass exc_info=True so the traceback is logged"
+    )
+
+
+async def test_api_wrapper_unexpected_exception_propagates_unwrapped() -> None:
+    """Exceptions outside the handled set keep their original type."""
+    session = MagicMock()
+    session.request = AsyncMock(side_effect=RuntimeError("kaboom"))
+    client = EngieBeApiClient(
+        session=session,
+        client_id="client-1",
+        refresh_token="v0.x",  # noqa: S106
     )
 
+    with pytest.raises(RuntimeError, match="kaboom"):
+        await client.async_refresh_token()
+
 
 # ---------------------------------------------------------------------------
 # E2E: EPEX inline path
@@ -881,6 +897,28 @@ async def test_api_wrapper_returns_text_body_when_not_json(
     assert result == "pong"
 
 
+async def test_api_wrapper_discard_body_drains_without_decoding(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """``discard_body=True`` with DEBUG off reads raw bytes and returns ``""``."""
+    response = _make_response(status=200, text_body="<html/>", content_type="text/html")
+    response.read = AsyncMock(return_value=b"<html/>")
+    session = _make_session(response)
+    client = EngieBeApiClient(session=session, client_id="c", access_token="t")  # noqa: S106
+
+    with caplog.at_level(logging.INFO, logger=_LOGGER_NAME):
+        result = await client._api_wrapper(
+            session=session,
+            method="GET",
+            url="https://api.example/x",
+            discard_body=True,
+        )
+
+    assert result == ""
+    response.read.assert_awaited_once()
+    response.text.assert_not_awaited()
+
+
 async def test_api_wrapper_include_headers_returns_tuple() -> None:
     """``include_headers=True`` returns a ``(body, headers)`` tuple."""
     response = _make_response(status=200, text_body="pong", content_type="text/plain")
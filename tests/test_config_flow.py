@@ -380,6 +380,30 @@ async def test_user_flow_invalid_credentials(
     assert result["errors"] == {"base": "auth"}
 
 
+async def test_user_flow_error_redisplay_suggests_username_not_password(
+    hass: HomeAssistant,
+    enable_custom_integrations: object,  # noqa: ARG001
+) -> None:
+    """The redisplayed user form re-fills the username but never the password."""
+    with patch(
+        "custom_components.engie_be.config_flow.EngieBeApiClient.async_start_authentication",
+        AsyncMock(side_effect=EngieBeApiClientAuthenticationError("bad creds")),
+    ):
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN, context={"source": config_entries.SOURCE_USER}
+        )
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], _USER_INPUT
+        )
+
+    suggested = {
+        str(key): (key.description or {}).get("suggested_value")
+        for key in result["data_schema"].schema
+    }
+    assert suggested[CONF_USERNAME] == _USER_INPUT[CONF_USERNAME]
+    assert suggested[CONF_PASSWORD] is None
+
+
 async def test_user_flow_invalid_mfa_code(
     hass: HomeAssistant,
     enable_custom_integrations: object,  # noqa: ARG001
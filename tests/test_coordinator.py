@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import json
-from datetime import timedelta
+from datetime import date, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock
@@ -15,9 +15,11 @@ from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import UpdateFailed
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from custom_components.engie_be._prices import parse_price_items
 from custom_components.engie_be.api import (
     EngieBeApiClientAuthenticationError,
     EngieBeApiClientError,
+    mask_identifier,
 )
 from custom_components.engie_be.const import (
     CONF_ACCESS_TOKEN,
@@ -28,12 +30,15 @@ from custom_components.engie_be.const import (
     CONF_UPDATE_INTERVAL,
     DEFAULT_UPDATE_INTERVAL_MINUTES,
     DOMAIN,
+    KEY_PRICES_BY_EAN,
+    KEY_PRICES_DATE,
     SUBENTRY_TYPE_BUSINESS_AGREEMENT,
 )
 from custom_components.engie_be.coordinator import EngieBeDataUpdateCoordinator
 from custom_components.engie_be.data import EngieBeData
 
 if TYPE_CHECKING:
+    from freezegun.api import FrozenDateTimeFactory
     from homeassistant.config_entries import ConfigSubentry
     from homeassistant.core import HomeAssistant
 
@@ -97,6 +102,21 @@ def _attach_runtime(entry: MockConfigEntry, client: MagicMock) -> None:
     )
 
 
+async def test_coordinator_masks_agreement_number_at_init(
+    hass: HomeAssistant,
+) -> None:
+    """The BAN is masked once at construction and only its tail is kept."""
+    entry = _build_entry(hass, business_agreement_number="002200000001")
+    coordinator = EngieBeDataUpdateCoordinator(
+        hass=hass,
+        config_entry=entry,
+        subentry=_only_subentry(entry),
+    )
+    assert coordinator._ban_masked == mask_identifier("002200000001")
+    assert coordinator._ban_masked.endswith("0001")
+    assert "00220000" not in coordinator._ban_masked
+
+
 async def test_async_update_data_returns_payload_on_success(
     hass: HomeAssistant,
 ) -> None:
@@ -123,11 +143,40 @@ async def test_async_update_data_returns_payload_on_success(
     assert result["items"] == payload["items"]
     assert result["peaks"]["data"] == peaks_payload
     assert result["peaks"]["is_fallback"] is False
+    # Price sensors read entries parsed once per refresh, keyed by EAN.
+    assert result[KEY_PRICES_BY_EAN] == parse_price_items(payload["items"])
+    assert isinstance(result[KEY_PRICES_DATE], int)
     assert coordinator.last_successful_fetch is not None
     client.async_get_prices.assert_awaited_once_with("B-0001")
     client.async_get_monthly_peaks.assert_awaited_once()
 
 
+async def test_async_update_data_stamps_brussels_price_date(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """The price lookup date is the Brussels calendar day, not the UTC one."""
+    # 22:30 UTC on 30 April is already 1 May in Brussels (UTC+2).
+    freezer.move_to("2026-04-30T22:30:00Z")
+    entry = _build_entry(hass)
+
+    client = MagicMock()
+    client.async_get_prices = AsyncMock(return_value={"items": []})
+    client.async_get_monthly_peaks = AsyncMock(return_value={})
+    client.async_get_happy_hour_event = AsyncMock(return_value={})
+    client.async_get_happy_hours_service_enabled_flag = AsyncMock(return_value={})
+    _attach_runtime(entry, client)
+
+    coordinator = EngieBeDataUpdateCoordinator(
+        hass=hass,
+        config_entry=entry,
+        subentry=_only_subentry(entry),
+    )
+    result = await coordinator._async_update_data()
+
+    assert result[KEY_PRICES_DATE] == date(2026, 5, 1).toordinal()
+
+
 async def test_async_update_data_raises_config_entry_auth_failed_on_auth_error(
     hass: HomeAssistant,
 ) -> None:
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING
 from unittest.mock import MagicMock
 
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.device_registry import DeviceInfo
 
 from custom_components.engie_be.const import (
     CONF_BUSINESS_AGREEMENT_NUMBER,
@@ -195,12 +196,27 @@ def test_transition_event_device_info_matches_subentry_device() -> None:
     """The event entity attaches to the same device as its sibling entities."""
     entry = MagicMock()
     entry.entry_id = "test_entry_id"
+    entry.runtime_data.subentry_data = {}
     subentry = _make_subentry(subentry_id="sub_xyz")
     entity = EngieBeTransitionEvent(EPEX_EVENTS_DESCRIPTION, entry, subentry)
     assert entity.device_info is not None
     assert entity.device_info["identifiers"] == {(DOMAIN, "sub_xyz")}
 
 
+def test_transition_event_uses_device_info_from_subentry_runtime_data() -> None:
+    """The device info built at setup for the account is the one attached."""
+    subentry = _make_subentry(subentry_id="sub_shared")
+    entry = _make_entry({"sub_shared": subentry})
+    entry.runtime_data.subentry_data["sub_shared"].device_info = DeviceInfo(
+        identifiers={(DOMAIN, "sub_shared")},
+        manufacturer="ENGIE Belgium",
+        name="Account built at setup",
+    )
+    entity = EngieBeTransitionEvent(EPEX_EVENTS_DESCRIPTION, entry, subentry)
+    assert entity.device_info is not None
+    assert entity.device_info["name"] == "Account built at setup"
+
+
 def test_authentication_event_unique_id_is_entry_scoped() -> None:
     """The auth event entity's unique_id has no subentry component."""
     entry = MagicMock()
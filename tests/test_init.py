@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
-from datetime import date, timedelta
+from base64 import urlsafe_b64encode
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timedelta
 from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -17,12 +21,14 @@ from homeassistant.config_entries import (
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.engie_be import (
     _async_populate_dynamic_flags,
     _async_populate_service_points,
     _persist_tokens,
+    _token_refresh_delay,
     async_migrate_entry,
     async_reload_entry,
     async_remove_config_entry_device,
@@ -51,11 +57,14 @@ from custom_components.engie_be.const import (
     ENERGY_TYPE_OPTIONS,
     SIGNAL_AUTHENTICATION_STATE_CHANGED,
     SUBENTRY_TYPE_BUSINESS_AGREEMENT,
+    TOKEN_REFRESH_INTERVAL_SECONDS,
+    TOKEN_REFRESH_MARGIN_SECONDS,
+    TOKEN_REFRESH_MIN_DELAY_SECONDS,
 )
 from custom_components.engie_be.data import EngieBeData
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import AsyncIterator, Callable
 
     from homeassistant.core import HomeAssistant
 
@@ -63,10 +72,18 @@ if TYPE_CHECKING:
 _TEST_SUBENTRY_TITLE = "Rue de la Loi 16, 1000 Brussels"
 
 
+def _jwt_with_exp(expiry: datetime) -> str:
+    """Build an unsigned JWT whose payload carries ``exp`` = *expiry*."""
+    payload = json.dumps({"exp": int(expiry.timestamp())}).encode()
+    segment = urlsafe_b64encode(payload).rstrip(b"=").decode("ascii")
+    return f"e30.{segment}.sig"
+
+
 def _build_entry(
     hass: HomeAssistant,
     *,
     business_agreement_number: str = "000000000001",
+    access_token: str = "stored-access",  # noqa: S107
 ) -> MockConfigEntry:
     """
     Build a v5 MockConfigEntry with credentials, tokens, and one subentry.
@@ -85,7 +102,7 @@ def _build_entry(
         data={
             CONF_USERNAME: "user@example.com",
             CONF_PASSWORD: "hunter2",
-            CONF_ACCESS_TOKEN: "stored-access",
+            CONF_ACCESS_TOKEN: access_token,
             CONF_REFRESH_TOKEN: "stored-refresh",
         },
         options={"update_interval": 60},
@@ -192,6 +209,58 @@ def _make_client(  # noqa: PLR0913 - kwargs-only test helper, one knob per endpo
     return client
 
 
+@asynccontextmanager
+async def _setup_with_captured_refresh(
+    hass: HomeAssistant,
+    entry: MockConfigEntry,
+    client: MagicMock,
+) -> AsyncIterator[tuple[list[Callable[[object], Any]], list[float]]]:
+    """
+    Set up *entry* against *client*, capturing every token-refresh timer.
+
+    Yields the callbacks and delays handed to ``async_call_later`` (first
+    the one armed at setup, then any re-arm). The patches stay active for
+    the body so a callback fired there re-arms into the lists instead of
+    scheduling a real timer. The coordinators' first refreshes are
+    stubbed out.
+    """
+    callbacks: list[Callable[[object], Any]] = []
+    delays: list[float] = []
+
+    def _capture_callback(
+        _hass: HomeAssistant,
+        delay: float,
+        callback: Callable[[object], Any],
+    ) -> MagicMock:
+        delays.append(delay)
+        callbacks.append(callback)
+        return MagicMock()
+
+    with (
+        patch(
+            "custom_components.engie_be.EngieBeApiClient",
+            return_value=client,
+        ),
+        patch(
+            "custom_components.engie_be.async_call_later",
+            side_effect=_capture_callback,
+        ),
+        patch(
+            "custom_components.engie_be.coordinator.EngieBeDataUpdateCoordinator"
+            ".async_config_entry_first_refresh",
+            new=AsyncMock(return_value=None),
+        ),
+        patch(
+            "custom_components.engie_be.coordinator.EngieBeEpexCoordinator"
+            ".async_config_entry_first_refresh",
+            new=AsyncMock(return_value=None),
+        ),
+    ):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        yield callbacks, delays
+
+
 async def test_setup_entry_persists_refreshed_tokens(
     hass: HomeAssistant,
     enable_custom_integrations: object,  # noqa: ARG001
@@ -226,6 +295,61 @@ async def test_setup_entry_persists_refreshed_tokens(
     # Old credentials must be untouched
     assert entry.data[CONF_USERNAME] == "user@example.com"
     assert entry.data[CONF_PASSWORD] == "hunter2"
+    # The account device info is built once per subentry for its entities.
+    subentry_id = _only_subentry_id(entry)
+    device_info = entry.runtime_data.subentry_data[subentry_id].device_info
+    assert device_info is not None
+    assert device_info["identifiers"] == {(DOMAIN, subentry_id)}
+    assert device_info["name"] == _TEST_SUBENTRY_TITLE
+
+
+@pytest.mark.parametrize(
+    "validity",
+    [timedelta(hours=1), timedelta(seconds=110)],
+    ids=["one_hour", "typical_two_minute_token"],
+)
+async def test_setup_entry_reuses_still_valid_access_token(
+    hass: HomeAssistant,
+    enable_custom_integrations: object,  # noqa: ARG001
+    validity: timedelta,
+) -> None:
+    """
+    A persisted access token the scheduled refresh can still rotate is reused.
+
+    ENGIE access tokens live about two minutes, so one restored shortly
+    after a restart must skip the startup refresh too; the timer armed at
+    setup then rotates it ahead of its ``exp``.
+    """
+    stored_access = _jwt_with_exp(dt_util.utcnow() + validity)
+    entry = _build_entry(hass, access_token=stored_access)
+    client = _make_client()
+    client.access_token = stored_access
+
+    async with _setup_with_captured_refresh(hass, entry, client) as (_, delays):
+        assert entry.state is ConfigEntryState.LOADED
+
+    client.async_refresh_token.assert_not_awaited()
+    assert entry.data[CONF_ACCESS_TOKEN] == stored_access
+    assert entry.data[CONF_REFRESH_TOKEN] == "stored-refresh"
+    assert entry.runtime_data.authenticated is True
+    assert delays[0] <= validity.total_seconds() - TOKEN_REFRESH_MARGIN_SECONDS
+
+
+async def test_setup_entry_refreshes_access_token_too_close_to_expiry(
+    hass: HomeAssistant,
+    enable_custom_integrations: object,  # noqa: ARG001
+) -> None:
+    """A persisted token the scheduled refresh could not beat is refreshed first."""
+    stored_access = _jwt_with_exp(dt_util.utcnow() + timedelta(seconds=60))
+    entry = _build_entry(hass, access_token=stored_access)
+    client = _make_client(refresh_return=("fresh-access", "fresh-refresh"))
+    client.access_token = stored_access
+
+    async with _setup_with_captured_refresh(hass, entry, client):
+        assert entry.state is ConfigEntryState.LOADED
+
+    client.async_refresh_token.assert_awaited_once()
+    assert entry.data[CONF_ACCESS_TOKEN] == "fresh-access"
 
 
 async def test_setup_entry_raises_config_entry_auth_failed_on_initial_refresh(
@@ -285,60 +409,30 @@ async def test_periodic_refresh_callback_starts_reauth_on_auth_error(
 
     Vector B in the reauth design: the path that fires when a long-running
     integration sees its refresh token invalidated mid-session. We capture the
-    callback registered via async_track_time_interval, then invoke it directly
+    callback registered via async_call_later, then invoke it directly
     after re-arming the mocked client to raise an auth error.
     """
     entry = _build_entry(hass)
     client = _make_client()
 
-    captured: list[Callable[[object], Any]] = []
-
-    def _capture_callback(
-        _hass: HomeAssistant,
-        callback: Callable[[object], Any],
-        _interval: object,
-    ) -> Callable[[], None]:
-        captured.append(callback)
-        return MagicMock()
-
-    with (
-        patch(
-            "custom_components.engie_be.EngieBeApiClient",
-            return_value=client,
-        ),
-        patch(
-            "custom_components.engie_be.async_track_time_interval",
-            side_effect=_capture_callback,
-        ),
-        patch(
-            "custom_components.engie_be.coordinator.EngieBeDataUpdateCoordinator"
-            ".async_config_entry_first_refresh",
-            new=AsyncMock(return_value=None),
-        ),
-        patch(
-            "custom_components.engie_be.coordinator.EngieBeEpexCoordinator"
-            ".async_config_entry_first_refresh",
-            new=AsyncMock(return_value=None),
-        ),
-    ):
-        await hass.config_entries.async_setup(entry.entry_id)
-        await hass.async_block_till_done()
-
-    assert len(captured) == 1, "Expected exactly one time-interval callback"
-    refresh_callback = captured[0]
+    async with _setup_with_captured_refresh(hass, entry, client) as (captured, _):
+        assert len(captured) == 1, "Expected exactly one scheduled refresh callback"
+        refresh_callback = captured[0]
 
-    # Sanity: setup completed authenticated
-    assert entry.runtime_data.authenticated is True
+        # Sanity: setup completed authenticated
+        assert entry.runtime_data.authenticated is True
 
-    # Re-arm the client to reject the refresh, then trigger the callback
-    client.async_refresh_token = AsyncMock(
-        side_effect=EngieBeApiClientAuthenticationError("revoked"),
-    )
-    with (
-        patch.object(entry, "async_start_reauth") as start_reauth,
-        patch("custom_components.engie_be.async_dispatcher_send") as dispatcher_send,
-    ):
-        await refresh_callback(None)
+        # Re-arm the client to reject the refresh, then trigger the callback
+        client.async_refresh_token = AsyncMock(
+            side_effect=EngieBeApiClientAuthenticationError("revoked"),
+        )
+        with (
+            patch.object(entry, "async_start_reauth") as start_reauth,
+            patch(
+                "custom_components.engie_be.async_dispatcher_send"
+            ) as dispatcher_send,
+        ):
+            await refresh_callback(None)
 
     assert entry.runtime_data.authenticated is False
     start_reauth.assert_called_once_with(hass)
@@ -348,72 +442,159 @@ async def test_periodic_refresh_callback_starts_reauth_on_auth_error(
     )
 
 
-async def test_periodic_refresh_callback_cancels_timer_on_auth_error(
+async def test_periodic_refresh_callback_does_not_rearm_on_auth_error(
     hass: HomeAssistant,
     enable_custom_integrations: object,  # noqa: ARG001
 ) -> None:
     """
-    The 60s refresh callback must cancel its own timer on an auth error.
+    The refresh callback must not re-arm its timer on an auth error.
 
-    Without cancellation the timer keeps firing every 60s, hitting 403 on
-    each tick and spamming reauth calls until the user completes the flow.
-    After an auth failure the cancel callable stored on
-    ``runtime_data.cancel_token_refresh`` must be called exactly once and
-    the field must be cleared to ``None`` so no stale reference lingers.
+    Re-arming would keep firing 403s until the user completes the reauth
+    flow. After an auth failure no new timer is scheduled and
+    ``runtime_data.cancel_token_refresh`` is cleared to ``None`` so no stale
+    handle lingers.
     """
     entry = _build_entry(hass)
     client = _make_client()
 
-    captured: list[Callable[[object], Any]] = []
-    cancel_mock = MagicMock()
+    async with _setup_with_captured_refresh(hass, entry, client) as (captured, _):
+        assert len(captured) == 1, "Expected exactly one scheduled refresh callback"
+        refresh_callback = captured[0]
 
-    def _capture_callback(
-        _hass: HomeAssistant,
-        callback: Callable[[object], Any],
-        _interval: object,
-    ) -> MagicMock:
-        captured.append(callback)
-        return cancel_mock
+        # The cancel callable must be stored on runtime_data after setup.
+        cancel_mock = entry.runtime_data.cancel_token_refresh
+        assert isinstance(cancel_mock, MagicMock)
 
-    with (
-        patch(
-            "custom_components.engie_be.EngieBeApiClient",
-            return_value=client,
-        ),
-        patch(
-            "custom_components.engie_be.async_track_time_interval",
-            side_effect=_capture_callback,
-        ),
-        patch(
-            "custom_components.engie_be.coordinator.EngieBeDataUpdateCoordinator"
-            ".async_config_entry_first_refresh",
-            new=AsyncMock(return_value=None),
-        ),
-        patch(
-            "custom_components.engie_be.coordinator.EngieBeEpexCoordinator"
-            ".async_config_entry_first_refresh",
-            new=AsyncMock(return_value=None),
-        ),
+        # Re-arm the client to reject the next refresh with an auth error.
+        client.async_refresh_token = AsyncMock(
+            side_effect=EngieBeApiClientAuthenticationError("revoked"),
+        )
+        with patch.object(entry, "async_start_reauth"):
+            await refresh_callback(None)
+
+    # No new timer was armed and the fired handle was dropped.
+    assert len(captured) == 1
+    cancel_mock.assert_not_called()
+    assert entry.runtime_data.cancel_token_refresh is None
+
+
+async def test_periodic_refresh_callback_rearms_retry_on_error(
+    hass: HomeAssistant,
+    enable_custom_integrations: object,  # noqa: ARG001
+) -> None:
+    """A transient refresh failure re-arms the timer at the fixed retry delay."""
+    entry = _build_entry(hass)
+    client = _make_client()
+
+    async with _setup_with_captured_refresh(hass, entry, client) as (
+        captured,
+        delays,
     ):
-        await hass.config_entries.async_setup(entry.entry_id)
-        await hass.async_block_till_done()
+        client.async_refresh_token = AsyncMock(
+            side_effect=EngieBeApiClientError("upstream down"),
+        )
+        await captured[0](None)
+
+    assert delays == [TOKEN_REFRESH_INTERVAL_SECONDS, TOKEN_REFRESH_INTERVAL_SECONDS]
+    assert entry.runtime_data.cancel_token_refresh is not None
+
+
+async def test_periodic_refresh_callback_rearms_retry_on_unexpected_error(
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+    enable_custom_integrations: object,  # noqa: ARG001
+) -> None:
+    """
+    An unexpected exception still re-arms the timer at the retry delay.
+
+    A non-``EngieBeApiClientError`` (e.g. a ``KeyError`` from a 200 response
+    missing ``access_token``) must not end token refresh for good; it is
+    logged and the one-shot timer is re-armed like any transient failure.
+    """
+    entry = _build_entry(hass)
+    client = _make_client()
+
+    async with _setup_with_captured_refresh(hass, entry, client) as (
+        captured,
+        delays,
+    ):
+        client.async_refresh_token = AsyncMock(side_effect=KeyError("access_token"))
+        with caplog.at_level(logging.ERROR, logger="custom_components.engie_be"):
+            await captured[0](None)
+
+    assert delays == [TOKEN_REFRESH_INTERVAL_SECONDS, TOKEN_REFRESH_INTERVAL_SECONDS]
+    assert entry.runtime_data.cancel_token_refresh is not None
+    assert entry.runtime_data.authenticated is False
+    assert "Unexpected error during scheduled token refresh" in caplog.text
+
+
+async def test_periodic_refresh_callback_does_not_rearm_after_unload(
+    hass: HomeAssistant,
+    enable_custom_integrations: object,  # noqa: ARG001
+) -> None:
+    """
+    A refresh still in flight when the entry unloads must not re-arm.
+
+    The timer handle is dropped when the callback starts, so the unload
+    has nothing to cancel; the callback itself has to notice the unload
+    once ``async_refresh_token`` returns, or it would keep a dead client
+    rotating the shared refresh token.
+    """
+    entry = _build_entry(hass)
+    client = _make_client()
 
-    assert len(captured) == 1, "Expected exactly one time-interval callback"
-    refresh_callback = captured[0]
+    release = asyncio.Event()
 
-    # The cancel callable must be stored on runtime_data after setup.
-    assert entry.runtime_data.cancel_token_refresh is cancel_mock
+    async def _pending_refresh() -> tuple[str, str]:
+        await release.wait()
+        raise EngieBeApiClientError("upstream down")
 
-    # Re-arm the client to reject the next refresh with an auth error.
-    client.async_refresh_token = AsyncMock(
-        side_effect=EngieBeApiClientAuthenticationError("revoked"),
+    async with _setup_with_captured_refresh(hass, entry, client) as (captured, _):
+        assert len(captured) == 1
+        # Unloading drops runtime_data from the entry; keep the instance
+        # the callback writes to.
+        runtime = entry.runtime_data
+
+        client.async_refresh_token = AsyncMock(side_effect=_pending_refresh)
+        task = hass.async_create_task(captured[0](None))
+        await asyncio.sleep(0)
+
+        assert await hass.config_entries.async_unload(entry.entry_id)
+        release.set()
+        await task
+
+    assert len(captured) == 1
+    assert runtime.cancel_token_refresh is None
+
+
+def test_token_refresh_delay_targets_margin_before_expiry() -> None:
+    """The next refresh fires the configured margin before the JWT ``exp``."""
+    expiry = dt_util.utcnow() + timedelta(hours=1)
+    delay = _token_refresh_delay(_jwt_with_exp(expiry))
+    expected = 3600 - TOKEN_REFRESH_MARGIN_SECONDS
+    assert expected - 5 <= delay <= expected
+
+
+def test_token_refresh_delay_floors_nearly_expired_token() -> None:
+    """An already-expired token never schedules a refresh sooner than the floor."""
+    expiry = dt_util.utcnow() - timedelta(minutes=5)
+    assert _token_refresh_delay(_jwt_with_exp(expiry)) == (
+        TOKEN_REFRESH_MIN_DELAY_SECONDS
     )
-    with patch.object(entry, "async_start_reauth"):
-        await refresh_callback(None)
 
-    # Timer must have been cancelled and the field cleared.
-    cancel_mock.assert_called_once()
-    assert entry.runtime_data.cancel_token_refresh is None
+
+def test_token_refresh_delay_falls_back_for_opaque_token() -> None:
+    """A token without a readable ``exp`` uses the fixed fallback interval."""
+    assert _token_refresh_delay("opaque-token") == TOKEN_REFRESH_INTERVAL_SECONDS
+    assert _token_refresh_delay(None) == TOKEN_REFRESH_INTERVAL_SECONDS
+
+
+def test_token_refresh_delay_falls_back_for_out_of_range_exp() -> None:
+    """An ``exp`` past datetime's range (e.g. in milliseconds) is treated as opaque."""
+    payload = json.dumps({"exp": 10**12}).encode()
+    segment = urlsafe_b64encode(payload).rstrip(b"=").decode("ascii")
+    token = f"e30.{segment}.sig"
+    assert _token_refresh_delay(token) == TOKEN_REFRESH_INTERVAL_SECONDS
 
 
 async def test_periodic_refresh_callback_logs_exception_detail_on_error(
@@ -434,54 +615,24 @@ async def test_periodic_refresh_callback_logs_exception_detail_on_error(
     entry = _build_entry(hass)
     client = _make_client()
 
-    captured: list[Callable[[object], Any]] = []
-
-    def _capture_callback(
-        _hass: HomeAssistant,
-        callback: Callable[[object], Any],
-        _interval: object,
-    ) -> Callable[[], None]:
-        captured.append(callback)
-        return MagicMock()
+    async with _setup_with_captured_refresh(hass, entry, client) as (captured, _):
+        refresh_callback = captured[0]
 
-    with (
-        patch(
-            "custom_components.engie_be.EngieBeApiClient",
-            return_value=client,
-        ),
-        patch(
-            "custom_components.engie_be.async_track_time_interval",
-            side_effect=_capture_callback,
-        ),
-        patch(
-            "custom_components.engie_be.coordinator.EngieBeDataUpdateCoordinator"
-            ".async_config_entry_first_refresh",
-            new=AsyncMock(return_value=None),
-        ),
-        patch(
-            "custom_components.engie_be.coordinator.EngieBeEpexCoordinator"
-            ".async_config_entry_first_refresh",
-            new=AsyncMock(return_value=None),
-        ),
-    ):
-        await hass.config_entries.async_setup(entry.entry_id)
-        await hass.async_block_till_done()
-
-    refresh_callback = captured[0]
-
-    # Re-arm the client to fail with a non-auth communication error that
-    # carries the upstream-shaped message the real API client would emit.
-    client.async_refresh_token = AsyncMock(
-        side_effect=EngieBeApiClientError(
-            "Error communicating with Engie API (ClientConnectorError)",
-        ),
-    )
-    caplog.clear()
-    with (
-        caplog.at_level(logging.WARNING, logger="custom_components.engie_be"),
-        patch("custom_components.engie_be.async_dispatcher_send") as dispatcher_send,
-    ):
-        await refresh_callback(None)
+        # Re-arm the client to fail with a non-auth communication error that
+        # carries the upstream-shaped message the real API client would emit.
+        client.async_refresh_token = AsyncMock(
+            side_effect=EngieBeApiClientError(
+                "Error communicating with Engie API (ClientConnectorError)",
+            ),
+        )
+        caplog.clear()
+        with (
+            caplog.at_level(logging.WARNING, logger="custom_components.engie_be"),
+            patch(
+                "custom_components.engie_be.async_dispatcher_send"
+            ) as dispatcher_send,
+        ):
+            await refresh_callback(None)
 
     matching = [
         record
@@ -1585,55 +1736,25 @@ async def test_periodic_refresh_callback_persists_tokens_on_success(
     entry = _build_entry(hass)
     client = _make_client()
 
-    captured: list[Callable[[object], Any]] = []
+    async with _setup_with_captured_refresh(hass, entry, client) as (captured, _):
+        refresh_callback = captured[0]
 
-    def _capture_callback(
-        _hass: HomeAssistant,
-        callback: Callable[[object], Any],
-        _interval: object,
-    ) -> Callable[[], None]:
-        captured.append(callback)
-        return MagicMock()
-
-    with (
-        patch(
-            "custom_components.engie_be.EngieBeApiClient",
-            return_value=client,
-        ),
-        patch(
-            "custom_components.engie_be.async_track_time_interval",
-            side_effect=_capture_callback,
-        ),
-        patch(
-            "custom_components.engie_be.coordinator.EngieBeDataUpdateCoordinator"
-            ".async_config_entry_first_refresh",
-            new=AsyncMock(return_value=None),
-        ),
-        patch(
-            "custom_components.engie_be.coordinator.EngieBeEpexCoordinator"
-            ".async_config_entry_first_refresh",
-            new=AsyncMock(return_value=None),
-        ),
-    ):
-        await hass.config_entries.async_setup(entry.entry_id)
-        await hass.async_block_till_done()
-
-    refresh_callback = captured[0]
-
-    # Flip the authed flag off and re-arm the client to rotate to a fresh
-    # token pair, then drive the callback: it must persist the new pair,
-    # flip ``authenticated`` back on and log the success at debug level.
-    entry.runtime_data.authenticated = False
-    client.async_refresh_token = AsyncMock(
-        return_value=("rotated-access-2", "rotated-refresh-2"),
-    )
-    caplog.clear()
-    with (
-        caplog.at_level(logging.DEBUG, logger="custom_components.engie_be"),
-        patch("custom_components.engie_be.async_dispatcher_send") as dispatcher_send,
-    ):
-        await refresh_callback(None)
-        await hass.async_block_till_done()
+        # Flip the authed flag off and re-arm the client to rotate to a fresh
+        # token pair, then drive the callback: it must persist the new pair,
+        # flip ``authenticated`` back on and log the success at debug level.
+        entry.runtime_data.authenticated = False
+        client.async_refresh_token = AsyncMock(
+            return_value=("rotated-access-2", "rotated-refresh-2"),
+        )
+        caplog.clear()
+        with (
+            caplog.at_level(logging.DEBUG, logger="custom_components.engie_be"),
+            patch(
+                "custom_components.engie_be.async_dispatcher_send"
+            ) as dispatcher_send,
+        ):
+            await refresh_callback(None)
+            await hass.async_block_till_done()
 
     assert entry.data[CONF_ACCESS_TOKEN] == "rotated-access-2"
     assert entry.data[CONF_REFRESH_TOKEN] == "rotated-refresh-2"
@@ -1645,6 +1766,32 @@ async def test_periodic_refresh_callback_persists_tokens_on_success(
     )
 
 
+async def test_periodic_refresh_callback_skips_broadcast_when_auth_unchanged(
+    hass: HomeAssistant,
+    enable_custom_integrations: object,  # noqa: ARG001
+) -> None:
+    """
+    A routine refresh that keeps the entry authenticated notifies nobody.
+
+    The auth binary sensor is the only consumer of ``authenticated`` and
+    listens on its own dispatcher signal, so an unchanged state must not
+    fan out to it (or to any coordinator listener) on every token rotation.
+    """
+    entry = _build_entry(hass)
+    client = _make_client()
+
+    async with _setup_with_captured_refresh(hass, entry, client) as (captured, _):
+        assert entry.runtime_data.authenticated is True
+
+        with patch(
+            "custom_components.engie_be.async_dispatcher_send"
+        ) as dispatcher_send:
+            await captured[0](None)
+
+    dispatcher_send.assert_not_called()
+    assert entry.runtime_data.authenticated is True
+
+
 # ---------------------------------------------------------------------------
 # First-refresh gather - exception prioritisation (auth > not-ready > first)
 # ---------------------------------------------------------------------------
@@ -0,0 +1,214 @@
+"""Tests for the supplier energy-prices payload helpers."""
+
+from __future__ import annotations
+
+import json
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from custom_components.engie_be._prices import (
+    current_price,
+    parse_price_items,
+    price_bounds,
+)
+
+_FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _load(name: str) -> dict:
+    """Load a JSON fixture by file name."""
+    return json.loads((_FIXTURES / name).read_text(encoding="utf-8"))
+
+
+# ---------------------------------------------------------------------------
+# parse_price_items
+# ---------------------------------------------------------------------------
+
+
+def test_parse_price_items_keys_entries_by_raw_ean() -> None:
+    """Every item is reachable by its unmodified (suffixed) EAN."""
+    items = _load("prices_sample.json")["items"]
+    index = parse_price_items(items)
+    assert list(index) == ["541448820000000001_ID1", "541448820000000002_ID1"]
+    assert len(index["541448820000000001_ID1"].windows) == len(items[0]["prices"])
+
+
+def test_parse_price_items_parses_window_and_rates() -> None:
+    """Dates become ordinals and slot values are keyed by direction/slot/field."""
+    items = _load("prices_sample.json")["items"]
+    entry = parse_price_items(items)["541448820000000001_ID1"].windows[0]
+    assert entry.from_ord == date(2000, 1, 1).toordinal()
+    assert entry.to_ord == date(2099, 12, 31).toordinal()
+    assert entry.valid_from == "2000-01-01"
+    assert entry.vat_tariff == pytest.approx(6.0)
+    assert entry.rates["offtake", "TOTAL_HOURS", "priceValue"] == pytest.approx(
+        0.123456
+    )
+    assert entry.rates["injection", "TOTAL_HOURS", "priceValueExclVAT"] == (
+        pytest.approx(0.04717)
+    )
+
+
+def test_parse_price_items_coerces_rates_to_float() -> None:
+    """Numeric strings become floats; None and non-numeric values are dropped."""
+    price = {
+        "from": "2026-01-01",
+        "to": "2027-01-01",
+        "proportionalPriceConfigurations": {
+            "offtake": [
+                {
+                    "timeOfUseSlotCode": "PEAK",
+                    "priceValue": "0.25",
+                    "priceValueExclVAT": None,
+                    "note": "N/A",
+                },
+            ],
+        },
+    }
+    entry = parse_price_items([{"ean": "E1", "prices": [price]}])["E1"].fallback
+    assert entry is not None
+    assert entry.rates == {("offtake", "PEAK", "priceValue"): 0.25}
+
+
+def test_parse_price_items_lists_slots_even_without_values() -> None:
+    """Slots are kept in order and default to TOTAL_HOURS, even when unpriced."""
+    price = {
+        "from": "2026-01-01",
+        "to": "2027-01-01",
+        "proportionalPriceConfigurations": {
+            "offtake": [
+                {"timeOfUseSlotCode": "PEAK", "priceValue": None},
+                {"priceValue": 0.2},
+                {"timeOfUseSlotCode": "PEAK", "priceValue": 0.3},
+            ],
+        },
+    }
+    entry = parse_price_items([{"ean": "E1", "prices": [price]}])["E1"].fallback
+    assert entry is not None
+    assert entry.slots == {"offtake": ("PEAK", "TOTAL_HOURS")}
+
+
+def test_parse_price_items_keeps_first_slot_entry_per_code() -> None:
+    """A repeated slot code resolves to its first occurrence."""
+    price = {
+        "from": "2026-01-01",
+        "to": "2027-01-01",
+        "proportionalPriceConfigurations": {
+            "offtake": [
+                {"timeOfUseSlotCode": "PEAK", "priceValue": 1},
+                {"timeOfUseSlotCode": "PEAK", "priceValue": 2},
+            ],
+        },
+    }
+    entry = parse_price_items([{"ean": "E1", "prices": [price]}])["E1"].fallback
+    assert entry is not None
+    assert entry.rates["offtake", "PEAK", "priceValue"] == 1
+
+
+def test_parse_price_items_skips_malformed_items() -> None:
+    """Non-dict items and items without a string EAN are left out."""
+    items = ["junk", {"prices": []}, {"ean": 42}, {"ean": "E1", "prices": []}]
+    assert list(parse_price_items(items)) == ["E1"]
+
+
+def test_parse_price_items_keeps_first_duplicate() -> None:
+    """A repeated EAN resolves to its first occurrence, like the old scan."""
+    first = {"ean": "E1", "prices": [{"from": "2026-01-01"}]}
+    second = {"ean": "E1", "prices": []}
+    assert parse_price_items([first, second])["E1"].fallback is not None
+
+
+def test_parse_price_items_non_list_returns_empty() -> None:
+    """A missing or non-list ``items`` field yields an empty index."""
+    assert parse_price_items(None) == {}
+    assert parse_price_items({"ean": "E1"}) == {}
+
+
+# ---------------------------------------------------------------------------
+# price_bounds
+# ---------------------------------------------------------------------------
+
+
+def test_price_bounds_parses_iso_dates() -> None:
+    """A raw entry is parsed from its ISO ``from``/``to`` strings."""
+    price = {"from": "2026-05-01", "to": "2026-06-01"}
+    assert price_bounds(price) == (
+        date(2026, 5, 1).toordinal(),
+        date(2026, 6, 1).toordinal(),
+    )
+
+
+def test_price_bounds_malformed_returns_none() -> None:
+    """Missing, unparseable or non-string dates yield ``None``."""
+    assert price_bounds({"to": "2026-06-01"}) is None
+    assert price_bounds({"from": "bad", "to": "2026-06-01"}) is None
+    assert price_bounds({"from": None, "to": "2026-06-01"}) is None
+    assert price_bounds("junk") is None
+
+
+# ---------------------------------------------------------------------------
+# current_price
+# ---------------------------------------------------------------------------
+
+
+def test_current_price_picks_covering_window_or_last() -> None:
+    """The covering window wins; otherwise the last entry is the fallback."""
+    prices = parse_price_items(
+        [
+            {
+                "ean": "E1",
+                "prices": [
+                    {"from": "2026-05-01", "to": "2026-06-01", "vatTariff": "may"},
+                    {"from": "2026-04-01", "to": "2026-05-01", "vatTariff": "apr"},
+                    {"from": "bad", "to": "bad", "vatTariff": "broken"},
+                ],
+            }
+        ]
+    )["E1"]
+    # Windows are sorted by start regardless of API order.
+    assert [w.vat_tariff for w in prices.windows] == ["apr", "may"]
+
+    def pick(day: date) -> object:
+        entry = current_price(prices, day.toordinal())
+        return entry.vat_tariff if entry else None
+
+    assert pick(date(2026, 4, 30)) == "apr"
+    assert pick(date(2026, 5, 1)) == "may"
+    assert pick(date(2026, 3, 1)) == "broken"
+    assert pick(date(2026, 7, 1)) == "broken"
+
+
+def test_current_price_overlapping_windows_take_first_in_api_order() -> None:
+    """Overlapping windows resolve to the first covering one, as listed."""
+    default = {"from": "2000-01-01", "to": "2099-12-31", "vatTariff": "default"}
+    may = {"from": "2026-05-01", "to": "2026-06-01", "vatTariff": "may"}
+
+    def pick(raw: list[dict], day: date) -> object:
+        prices = parse_price_items([{"ean": "E1", "prices": raw}])["E1"]
+        assert prices.overlapping
+        entry = current_price(prices, day.toordinal())
+        return entry.vat_tariff if entry else None
+
+    # Past the dated window, the open-ended one still covers the date
+    # rather than the stale last entry.
+    assert pick([default, may], date(2026, 7, 15)) == "default"
+    assert pick([default, may], date(2026, 5, 15)) == "default"
+    assert pick([may, default], date(2026, 5, 15)) == "may"
+    assert pick([may, default], date(2026, 7, 15)) == "default"
+
+
+def test_current_price_single_entry_is_returned_outside_its_window() -> None:
+    """A lone entry is both the only window and the fallback."""
+    prices = parse_price_items(
+        [{"ean": "E1", "prices": [{"from": "2026-05-01", "to": "2026-06-01"}]}]
+    )["E1"]
+    assert current_price(prices, date(2026, 5, 15).toordinal()) is prices.fallback
+    assert current_price(prices, date(2027, 1, 1).toordinal()) is prices.fallback
+
+
+def test_current_price_empty_returns_none() -> None:
+    """An EAN without price entries has nothing to fall back to."""
+    prices = parse_price_items([{"ean": "E1", "prices": []}])["E1"]
+    assert current_price(prices, date(2026, 7, 1).toordinal()) is None
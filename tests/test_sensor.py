@@ -3,17 +3,21 @@
 from __future__ import annotations
 
 import json
-from datetime import date, datetime, timedelta
+from datetime import date
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
-from zoneinfo import ZoneInfo
 
 import pytest
 from homeassistant.components.sensor import SensorEntityDescription
 from homeassistant.const import EntityCategory
 
-from custom_components.engie_be.const import SUBENTRY_TYPE_BUSINESS_AGREEMENT
+from custom_components.engie_be._prices import parse_price_items
+from custom_components.engie_be.const import (
+    KEY_PRICES_BY_EAN,
+    KEY_PRICES_DATE,
+    SUBENTRY_TYPE_BUSINESS_AGREEMENT,
+)
 from custom_components.engie_be.sensor import (
     _CAPTAR_LATEST_DAILY_PEAK,
     _CAPTAR_MONTHLY_PEAK_END,
@@ -25,7 +29,6 @@ from custom_components.engie_be.sensor import (
     _build_peak_sensors,
     _build_sensor_descriptions,
     _detect_energy_type,
-    _find_current_price,
     _normalize_slot_code,
     _slot_suffixes,
 )
@@ -38,6 +41,14 @@ def _load_fixture(name: str) -> dict[str, Any]:
     return json.loads((FIXTURES_DIR / name).read_text(encoding="utf-8"))
 
 
+def _parsed_prices_fixture() -> dict[str, Any]:
+    """Load prices_sample.json with the coordinator's derived price keys."""
+    data = _load_fixture("prices_sample.json")
+    data[KEY_PRICES_BY_EAN] = parse_price_items(data["items"])
+    data[KEY_PRICES_DATE] = date(2026, 7, 15).toordinal()
+    return data
+
+
 # ---------------------------------------------------------------------------
 # _normalize_slot_code
 # ---------------------------------------------------------------------------
@@ -85,191 +96,6 @@ def test_slot_suffixes(code: str, expected: tuple[str, str] | None) -> None:
     assert _slot_suffixes(code) == expected
 
 
-# ---------------------------------------------------------------------------
-# _find_current_price
-# ---------------------------------------------------------------------------
-
-
-def test_find_current_price_returns_matching_window() -> None:
-    """Returns the price entry whose date range covers today."""
-    today = date(2026, 7, 15)
-    yesterday = today - timedelta(days=1)
-    tomorrow = today + timedelta(days=1)
-    next_week = today + timedelta(days=7)
-
-    prices = [
-        {"from": yesterday.isoformat(), "to": tomorrow.isoformat(), "id": "current"},
-        {"from": tomorrow.isoformat(), "to": next_week.isoformat(), "id": "future"},
-    ]
-
-    with patch(
-        "custom_components.engie_be.sensor.dt_util.now",
-        return_value=datetime(2026, 7, 15, 12, 0, tzinfo=ZoneInfo("Europe/Brussels")),
-    ):
-        result = _find_current_price(prices)
-    assert result is not None
-    assert result["id"] == "current"
-
-
-def test_find_current_price_falls_back_to_last() -> None:
-    """When no entry covers today, the last entry is returned as fallback."""
-    today = date(2026, 7, 15)
-    long_ago = today - timedelta(days=60)
-    less_long_ago = today - timedelta(days=30)
-    recent_past = today - timedelta(days=1)
-
-    prices = [
-        {"from": long_ago.isoformat(), "to": less_long_ago.isoformat(), "id": "old"},
-        {
-            "from": less_long_ago.isoformat(),
-            "to": recent_past.isoformat(),
-            "id": "fallback",
-        },
-    ]
-
-    with patch(
-        "custom_components.engie_be.sensor.dt_util.now",
-        return_value=datetime(2026, 7, 15, 12, 0, tzinfo=ZoneInfo("Europe/Brussels")),
-    ):
-        result = _find_current_price(prices)
-    assert result is not None
-    assert result["id"] == "fallback"
-
-
-def test_find_current_price_empty_returns_none() -> None:
-    """Empty list returns None."""
-    assert _find_current_price([]) is None
-
-
-def test_find_current_price_uses_brussels_date_at_month_boundary() -> None:
-    """Brussels civil date must win at a UTC/Brussels month boundary."""
-    prices = [
-        {"from": "2026-04-01", "to": "2026-05-01", "id": "april"},
-        {"from": "2026-05-01", "to": "2026-06-01", "id": "may"},
-    ]
-    brussels = ZoneInfo("Europe/Brussels")
-    boundary_brussels = datetime(2026, 5, 1, 0, 30, 0, tzinfo=brussels)
-    with patch(
-        "custom_components.engie_be.sensor.dt_util.now",
-        return_value=boundary_brussels,
-    ):
-        result = _find_current_price(prices)
-    assert result is not None
-    assert result["id"] == "may"
-
-
-def test_find_current_price_skips_entry_missing_from_key() -> None:
-    """An entry missing the 'from' key is skipped in favour of a valid one."""
-    today = date(2026, 7, 15)
-    yesterday = today - timedelta(days=1)
-    tomorrow = today + timedelta(days=1)
-
-    prices = [
-        {"to": tomorrow.isoformat(), "id": "broken"},
-        {"from": yesterday.isoformat(), "to": tomorrow.isoformat(), "id": "current"},
-    ]
-
-    with patch(
-        "custom_components.engie_be.sensor.dt_util.now",
-        return_value=datetime(2026, 7, 15, 12, 0, tzinfo=ZoneInfo("Europe/Brussels")),
-    ):
-        result = _find_current_price(prices)
-    assert result is not None
-    assert result["id"] == "current"
-
-
-def test_find_current_price_skips_entry_missing_to_key() -> None:
-    """An entry missing the 'to' key is skipped in favour of a valid one."""
-    today = date(2026, 7, 15)
-    yesterday = today - timedelta(days=1)
-    tomorrow = today + timedelta(days=1)
-
-    prices = [
-        {"from": yesterday.isoformat(), "id": "broken"},
-        {"from": yesterday.isoformat(), "to": tomorrow.isoformat(), "id": "current"},
-    ]
-
-    with patch(
-        "custom_components.engie_be.sensor.dt_util.now",
-        return_value=datetime(2026, 7, 15, 12, 0, tzinfo=ZoneInfo("Europe/Brussels")),
-    ):
-        result = _find_current_price(prices)
-    assert result is not None
-    assert result["id"] == "current"
-
-
-def test_find_current_price_skips_unparseable_date_string() -> None:
-    """An entry with an unparseable date string is skipped."""
-    today = date(2026, 7, 15)
-    yesterday = today - timedelta(days=1)
-    tomorrow = today + timedelta(days=1)
-
-    prices = [
-        {"from": "not-a-date", "to": tomorrow.isoformat(), "id": "broken"},
-        {"from": yesterday.isoformat(), "to": tomorrow.isoformat(), "id": "current"},
-    ]
-
-    with patch(
-        "custom_components.engie_be.sensor.dt_util.now",
-        return_value=datetime(2026, 7, 15, 12, 0, tzinfo=ZoneInfo("Europe/Brussels")),
-    ):
-        result = _find_current_price(prices)
-    assert result is not None
-    assert result["id"] == "current"
-
-
-def test_find_current_price_skips_none_date_value() -> None:
-    """An entry whose date value is None is skipped."""
-    today = date(2026, 7, 15)
-    yesterday = today - timedelta(days=1)
-    tomorrow = today + timedelta(days=1)
-
-    prices = [
-        {"from": None, "to": tomorrow.isoformat(), "id": "broken"},
-        {"from": yesterday.isoformat(), "to": tomorrow.isoformat(), "id": "current"},
-    ]
-
-    with patch(
-        "custom_components.engie_be.sensor.dt_util.now",
-        return_value=datetime(2026, 7, 15, 12, 0, tzinfo=ZoneInfo("Europe/Brussels")),
-    ):
-        result = _find_current_price(prices)
-    assert result is not None
-    assert result["id"] == "current"
-
-
-def test_find_current_price_all_malformed_falls_back_without_crashing() -> None:
-    """When every entry is malformed, the function falls back to the last entry."""
-    prices = [
-        {"from": "not-a-date", "to": "also-not-a-date", "id": "broken1"},
-        {"id": "broken2"},
-    ]
-
-    result = _find_current_price(prices)
-    assert result is not None
-    assert result["id"] == "broken2"
-
-
-def test_find_current_price_mixed_malformed_and_valid() -> None:
-    """A malformed entry followed by a valid one still returns the valid entry."""
-    today = date(2026, 7, 15)
-    yesterday = today - timedelta(days=1)
-    tomorrow = today + timedelta(days=1)
-
-    prices = [
-        {"from": "bad", "to": "bad", "id": "broken"},
-        {"from": yesterday.isoformat(), "to": tomorrow.isoformat(), "id": "current"},
-    ]
-
-    with patch(
-        "custom_components.engie_be.sensor.dt_util.now",
-        return_value=datetime(2026, 7, 15, 12, 0, tzinfo=ZoneInfo("Europe/Brussels")),
-    ):
-        result = _find_current_price(prices)
-    assert result is not None
-    assert result["id"] == "current"
-
-
 # ---------------------------------------------------------------------------
 # _detect_energy_type
 # ---------------------------------------------------------------------------
@@ -298,16 +124,10 @@ def test_detect_energy_type_unknown_falls_back() -> None:
 
 def test_build_sensor_descriptions_skips_blended_en_slots() -> None:
     """Blended 'EN' slot codes must produce no sensor descriptions."""
-    data = _load_fixture("prices_sample.json")
+    data = _parsed_prices_fixture()
     service_points = _load_fixture("service_points_sample.json")
 
-    # Force _find_current_price to return our static fixture entry rather than
-    # depending on real time-of-day matching.
-    with patch(
-        "custom_components.engie_be.sensor._find_current_price",
-        side_effect=lambda prices: prices[0] if prices else None,
-    ):
-        descriptions = _build_sensor_descriptions(data, service_points)
+    descriptions = _build_sensor_descriptions(data, service_points)
 
     slot_codes = [slot for _, _, _, slot in descriptions]
     assert "EN" not in slot_codes
@@ -315,14 +135,10 @@ def test_build_sensor_descriptions_skips_blended_en_slots() -> None:
 
 def test_build_sensor_descriptions_emits_excl_vat_pair() -> None:
     """Each direction/slot must yield both an incl-VAT and excl-VAT sensor."""
-    data = _load_fixture("prices_sample.json")
+    data = _parsed_prices_fixture()
     service_points = _load_fixture("service_points_sample.json")
 
-    with patch(
-        "custom_components.engie_be.sensor._find_current_price",
-        side_effect=lambda prices: prices[0] if prices else None,
-    ):
-        descriptions = _build_sensor_descriptions(data, service_points)
+    descriptions = _build_sensor_descriptions(data, service_points)
 
     keys = [desc.key for desc, *_ in descriptions]
     # Sanity: every base key must have a matching `_excl_vat` sibling.
@@ -337,14 +153,10 @@ def test_build_sensor_descriptions_emits_excl_vat_pair() -> None:
 
 def test_build_sensor_descriptions_uses_translation_keys_per_energy_type() -> None:
     """Electricity and gas EANs must produce different translation key prefixes."""
-    data = _load_fixture("prices_sample.json")
+    data = _parsed_prices_fixture()
     service_points = _load_fixture("service_points_sample.json")
 
-    with patch(
-        "custom_components.engie_be.sensor._find_current_price",
-        side_effect=lambda prices: prices[0] if prices else None,
-    ):
-        descriptions = _build_sensor_descriptions(data, service_points)
+    descriptions = _build_sensor_descriptions(data, service_points)
 
     translation_keys = {desc.translation_key for desc, *_ in descriptions}
     assert any(k.startswith("electricity_") for k in translation_keys)
@@ -436,6 +248,45 @@ def test_energy_sensor_ean_attribute_strips_delivery_point_suffix() -> None:
     assert sensor._ean == "541448820000000001_ID1"
 
 
+def test_energy_sensor_resolves_price_entry_once_per_refresh() -> None:
+    """
+    Repeated reads within one coordinator tick reuse the resolved entry.
+
+    A new ``coordinator.data`` object (the next refresh) invalidates the
+    memo so the entry is resolved again.
+    """
+    data = _parsed_prices_fixture()
+    coordinator = MagicMock()
+    coordinator.config_entry = MagicMock()
+    coordinator.config_entry.entry_id = "test_entry_id"
+    coordinator.data = data
+
+    subentry = MagicMock()
+    subentry.subentry_id = "sub_xyz"
+    subentry.data = {}
+
+    sensor = EngieBeEnergySensor(
+        coordinator=coordinator,
+        subentry=subentry,
+        entity_description=SensorEntityDescription(key="k"),
+        ean="541448820000000001_ID1",
+        value_key="offtake.priceValue",
+        slot_code="TOTAL_HOURS",
+    )
+
+    with patch(
+        "custom_components.engie_be.sensor.current_price",
+        side_effect=lambda prices, _today: prices.windows[0],
+    ) as find:
+        assert sensor.native_value == pytest.approx(0.123456)
+        assert sensor.extra_state_attributes["from"] == "2000-01-01"
+        assert find.call_count == 1
+
+        coordinator.data = dict(data)
+        assert sensor.native_value == pytest.approx(0.123456)
+        assert find.call_count == 2
+
+
 # ---------------------------------------------------------------------------
 # entity-disabled-by-default: verify disabled-by-default flags on descriptions
 # ---------------------------------------------------------------------------
@@ -443,8 +294,8 @@ def test_energy_sensor_ean_attribute_strips_delivery_point_suffix() -> None:
 
 @pytest.fixture
 def sample_prices() -> dict[str, Any]:
-    """Return the prices_sample fixture for description-generation tests."""
-    return _load_fixture("prices_sample.json")
+    """Return the parsed prices_sample payload for description-generation tests."""
+    return _parsed_prices_fixture()
 
 
 def test_excl_vat_sensors_disabled_by_default(
@@ -491,14 +342,10 @@ def test_epex_extrema_sensors_enabled_by_default() -> None:
 
 def test_build_sensor_descriptions_expose_all_enables_excl_vat() -> None:
     """Expose-all forces excl-VAT sensor descriptions to enabled-by-default."""
-    data = _load_fixture("prices_sample.json")
+    data = _parsed_prices_fixture()
     service_points = _load_fixture("service_points_sample.json")
 
-    with patch(
-        "custom_components.engie_be.sensor._find_current_price",
-        side_effect=lambda prices: prices[0] if prices else None,
-    ):
-        descriptions = _build_sensor_descriptions(data, service_points, expose_all=True)
+    descriptions = _build_sensor_descriptions(data, service_points, expose_all=True)
 
     excl_vat_descs = [
         desc for desc, _ean, vk, _slot in descriptions if vk.endswith("ExclVAT")
@@ -512,14 +359,10 @@ def test_build_sensor_descriptions_expose_all_enables_excl_vat() -> None:
 
 def test_build_sensor_descriptions_default_keeps_excl_vat_disabled() -> None:
     """Without expose-all, excl-VAT sensors stay disabled-by-default."""
-    data = _load_fixture("prices_sample.json")
+    data = _parsed_prices_fixture()
     service_points = _load_fixture("service_points_sample.json")
 
-    with patch(
-        "custom_components.engie_be.sensor._find_current_price",
-        side_effect=lambda prices: prices[0] if prices else None,
-    ):
-        descriptions = _build_sensor_descriptions(data, service_points)
+    descriptions = _build_sensor_descriptions(data, service_points)
 
     excl_vat_descs = [
         desc for desc, _ean, vk, _slot in descriptions if vk.endswith("ExclVAT")
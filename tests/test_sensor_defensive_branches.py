@@ -11,8 +11,8 @@ Targets pre-v0.10.0b1 missing lines:
   when the subentry has no BAN.
 - L572, L577-586 -- ``native_value`` / ``extra_state_attributes`` happy paths.
 - L590-595 -- ``_get_current_price_entry`` early-out + EAN-miss + match.
-- L599-617 -- ``_get_price_value`` direction-missing / slot-missing / None /
-  matched-value branches.
+- L599-617 -- ``native_value`` price lookup direction-missing / slot-missing /
+  None / matched-value branches.
 
 Tests exercise the private helpers directly with crafted payloads; this
 mirrors the pattern used by ``tests/test_coordinator_defensive_branches.py``
@@ -22,7 +22,7 @@ and avoids spinning up full setup flows for unit-scope assertions.
 from __future__ import annotations
 
 import json
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock
@@ -31,8 +31,11 @@ import pytest
 from homeassistant.components.sensor import SensorEntityDescription
 from homeassistant.config_entries import ConfigSubentry
 
+from custom_components.engie_be._prices import parse_price_items
 from custom_components.engie_be.const import (
     CONF_BUSINESS_AGREEMENT_NUMBER,
+    KEY_PRICES_BY_EAN,
+    KEY_PRICES_DATE,
     SUBENTRY_TYPE_BUSINESS_AGREEMENT,
 )
 from custom_components.engie_be.sensor import (
@@ -56,7 +59,10 @@ def _coordinator_with_prices() -> MagicMock:
     coordinator = MagicMock()
     coordinator.config_entry = MagicMock()
     coordinator.config_entry.entry_id = "entry_abc"
-    coordinator.data = json.loads(_PRICES_FIXTURE.read_text())
+    data = json.loads(_PRICES_FIXTURE.read_text())
+    data[KEY_PRICES_BY_EAN] = parse_price_items(data["items"])
+    data[KEY_PRICES_DATE] = date(2026, 5, 22).toordinal()
+    coordinator.data = data
     coordinator.last_successful_fetch = datetime(2026, 5, 22, 12, 0, tzinfo=UTC)
     return coordinator
 
@@ -350,11 +356,11 @@ def test_get_current_price_entry_returns_none_when_ean_not_found() -> None:
 
 
 # ---------------------------------------------------------------------------
-# _get_price_value branches (L599-617)
+# native_value price lookup branches (L599-617)
 # ---------------------------------------------------------------------------
 
 
-def test_get_price_value_returns_none_when_no_price_entry() -> None:
+def test_native_value_returns_none_when_no_price_entry() -> None:
     """No price entry -> None (early-out at L600-601)."""
     coord = _coordinator_with_prices()
     sub = _subentry()
@@ -370,28 +376,28 @@ def test_get_price_value_returns_none_when_no_price_entry() -> None:
         value_key="offtake.priceValue",
         slot_code="TOTAL_HOURS",
     )
-    assert sensor._get_price_value() is None
+    assert sensor.native_value is None
 
 
-def test_get_price_value_returns_none_when_direction_missing() -> None:
+def test_native_value_returns_none_when_direction_missing() -> None:
     """A direction not present in the configurations -> None (L606-607)."""
     sensor = _build_energy_sensor(
         value_key="nonexistent_direction.priceValue",
         slot_code="TOTAL_HOURS",
     )
-    assert sensor._get_price_value() is None
+    assert sensor.native_value is None
 
 
-def test_get_price_value_returns_none_when_slot_code_missing() -> None:
+def test_native_value_returns_none_when_slot_code_missing() -> None:
     """No slot entry matches the sensor's slot_code -> fall through to None (L617)."""
     sensor = _build_energy_sensor(
         value_key="offtake.priceValue",
         slot_code="UNKNOWN_SLOT",
     )
-    assert sensor._get_price_value() is None
+    assert sensor.native_value is None
 
 
-def test_get_price_value_returns_none_when_field_value_is_none() -> None:
+def test_native_value_returns_none_when_field_value_is_none() -> None:
     """
     Return None when the matched slot's field value is None.
 
@@ -406,24 +412,25 @@ def test_get_price_value_returns_none_when_field_value_is_none() -> None:
             for slot in item["prices"][0]["proportionalPriceConfigurations"]["offtake"]:
                 if slot["timeOfUseSlotCode"] == "TOTAL_HOURS":
                     slot["priceValueExclVAT"] = None
+    coord.data[KEY_PRICES_BY_EAN] = parse_price_items(items)
     sensor = _build_energy_sensor(
         value_key="offtake.priceValueExclVAT",
         slot_code="TOTAL_HOURS",
         coordinator=coord,
     )
-    assert sensor._get_price_value() is None
+    assert sensor.native_value is None
 
 
-def test_get_price_value_returns_float_for_matched_slot() -> None:
+def test_native_value_returns_float_for_matched_slot() -> None:
     """A matched slot returns the float-cast value (L615)."""
     sensor = _build_energy_sensor(
         value_key="offtake.priceValueExclVAT",
         slot_code="TOTAL_HOURS",
     )
-    assert sensor._get_price_value() == pytest.approx(0.116468)
+    assert sensor.native_value == pytest.approx(0.116468)
 
 
-def test_get_price_value_returns_none_for_non_numeric_string() -> None:
+def test_native_value_returns_none_for_non_numeric_string() -> None:
     """Non-numeric string in matched slot returns None, not ValueError."""
     coord = _coordinator_with_prices()
     items = coord.data["items"]
@@ -432,9 +439,10 @@ def test_get_price_value_returns_none_for_non_numeric_string() -> None:
             for slot in item["prices"][0]["proportionalPriceConfigurations"]["offtake"]:
                 if slot["timeOfUseSlotCode"] == "TOTAL_HOURS":
                     slot["priceValue"] = "N/A"
+    coord.data[KEY_PRICES_BY_EAN] = parse_price_items(items)
     sensor = _build_energy_sensor(
         value_key="offtake.priceValue",
         slot_code="TOTAL_HOURS",
         coordinator=coord,
     )
-    assert sensor._get_price_value() is None
+    assert sensor.native_value is None